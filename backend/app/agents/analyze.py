@@ -113,44 +113,42 @@ class AnalyzeAgent:
             }
         )
 
-        # Merge speakers and create relationships
-        for speaker in entities.get("speakers", []):
-            name = speaker.get("name", "")
-            if not name:
-                continue
-            await self._neo4j.merge_person(
-                {
-                    "name": name,
-                    "role": speaker.get("role", ""),
-                    "company": speaker.get("company", ""),
-                }
-            )
-            await self._neo4j.create_relationship(
-                "Person", "name", name,
-                "SPEAKS_AT",
-                "Event", "url", enriched["url"],
-            )
-            company = speaker.get("company", "")
-            if company:
-                await self._neo4j.merge_company({"name": company})
-                await self._neo4j.create_relationship(
-                    "Person", "name", name,
-                    "WORKS_AT",
-                    "Company", "name", company,
-                )
-
-        # Merge companies mentioned in entities
-        for company_name in entities.get("companies", []):
-            await self._neo4j.merge_company({"name": company_name})
-
-        # Merge topics and tag event
-        for topic_name in entities.get("topics", []):
-            await self._neo4j.merge_topic({"name": topic_name})
-            await self._neo4j.create_relationship(
-                "Event", "url", enriched["url"],
-                "TAGGED",
-                "Topic", "name", topic_name,
+        # Collect speakers, companies and topics, then write each kind in
+        # one batched round trip
+        url = enriched["url"]
+        speakers = [
+            {
+                "name": speaker.get("name", ""),
+                "role": speaker.get("role", ""),
+                "company": speaker.get("company", ""),
+            }
+            for speaker in entities.get("speakers", [])
+            if speaker.get("name")
+        ]
+        works_at = [(s["name"], s["company"]) for s in speakers if s["company"]]
+        companies = list(
+            dict.fromkeys(
+                [company for _, company in works_at]
+                + list(entities.get("companies", []))
             )
+        )
+        topics = list(dict.fromkeys(entities.get("topics", [])))
+
+        await self._neo4j.merge_persons(speakers)
+        await self._neo4j.merge_companies([{"name": c} for c in companies])
+        await self._neo4j.merge_topics([{"name": t} for t in topics])
+
+        await self._neo4j.create_relationships(
+            "Person", "name", "SPEAKS_AT", "Event", "url",
+            [(s["name"], url) for s in speakers],
+        )
+        await self._neo4j.create_relationships(
+            "Person", "name", "WORKS_AT", "Company", "name", works_at
+        )
+        await self._neo4j.create_relationships(
+            "Event", "url", "TAGGED", "Topic", "name",
+            [(url, t) for t in topics],
+        )
 
     async def analyze_event(
         self, raw_event: dict[str, Any], user_profile: dict[str, Any]
@@ -8,14 +8,23 @@ tools to discover events, research people, and draft messages.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import logging
+import re
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import nullcontext
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, cast
 
 import anthropic
+import httpx
+from tavily.errors import TimeoutError as TavilyTimeoutError
+from tavily.errors import UsageLimitExceededError
 
 from app.core.config import NexusMode, settings
+from app.core.llm import get_anthropic
 from app.integrations.neo4j_client import Neo4jClient
 from app.integrations.reka_client import RekaClient
 from app.integrations.tavily_client import TavilyClient
@@ -332,6 +341,13 @@ TOOLS: list[dict[str, Any]] = [
 # All valid tool names for routing
 TOOL_NAMES: set[str] = {t["name"] for t in TOOLS}
 
+# Tools block sent to the API — a cache breakpoint on the last entry lets
+# Anthropic reuse the (static) tool definitions across turns.
+_CACHED_TOOLS: list[dict[str, Any]] = [
+    *TOOLS[:-1],
+    {**TOOLS[-1], "cache_control": {"type": "ephemeral"}},
+]
+
 # ── System Prompt ────────────────────────────────────────────────────────────
 
 SYSTEM_PROMPT = """You are Wingman, an autonomous networking agent for {user_name}.
@@ -448,6 +464,24 @@ IMPORTANT: Do NOT spend the whole cycle just searching. Search briefly, then APP
 The user wants you to actually register for events, not just find them.
 """
 
+# Static bodies of the user turns that drive the loop; only the timestamp
+# prefix changes between (re)starts and cycles.
+_KICKOFF_BODY = (
+    "Begin your autonomous cycle:\n"
+    "1. Search for upcoming events in SF matching my interests (1-2 tavily_search calls)\n"
+    "2. Pick the most relevant events and APPLY to them using yutori_browse\n"
+    "3. Save applied events to Neo4j\n"
+    "4. Research attendees at applied events\n"
+    "Start now — search for events, then apply to the best ones."
+)
+
+_CONTINUE_BODY = (
+    "Continue your cycle. If you found events, APPLY to the best ones "
+    "using yutori_browse NOW. If you already applied, research the "
+    "attendees. If you've done both, draft messages for interesting "
+    "people, then wait 1-2 hours."
+)
+
 
 # ── Side-effect tools (blocked in dry_run/replay modes) ─────────────────────
 
@@ -461,6 +495,106 @@ _SIDE_EFFECT_TOOLS: frozenset[str] = frozenset(
 )
 
 
+# Window in which queued WebSocket events are coalesced into one frame
+_WS_BATCH_WINDOW = 0.03
+
+# Map agent notify_user types to standard WS event types
+_WS_TYPE_MAP: dict[str, str] = {
+    "event_suggested": "event:analyzed",
+    "event_applied": "event:applied",
+}
+
+# Per-result snippet length kept from Tavily search content
+_SEARCH_CONTENT_CHARS = 500
+
+# Browse tasks mentioning any of these are reported as event applications
+_APPLY_RE = re.compile(r"apply|rsvp|register|sign up|attend", re.IGNORECASE)
+
+# Read-only tools whose results are memoized across turns
+_MEMOIZABLE_TOOLS: frozenset[str] = frozenset(
+    {"tavily_search", "reka_vision", "neo4j_query", "resolve_social_accounts"}
+)
+_TOOL_CACHE_TTL = 300.0  # seconds
+
+# Tools whose side effects can make memoized reads stale
+_CACHE_INVALIDATING_TOOLS: frozenset[str] = frozenset(
+    {"neo4j_write", "notify_user"}
+)
+
+
+# ── Per-tool concurrency limits (protect upstream rate limits) ─────────────
+
+_TOOL_CONCURRENCY: dict[str, int] = {
+    "tavily_search": 4,
+    "resolve_social_accounts": 4,
+    "yutori_browse": 2,
+    "yutori_scout": 2,
+    "reka_vision": 2,
+    "neo4j_query": 8,
+    "neo4j_write": 8,
+}
+
+# Created lazily so each semaphore binds to the loop that actually uses it.
+_tool_semaphores: dict[
+    str, tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]
+] = {}
+
+
+def _tool_semaphore(tool_name: str) -> asyncio.Semaphore | None:
+    limit = _TOOL_CONCURRENCY.get(tool_name)
+    if limit is None:
+        return None
+    loop = asyncio.get_running_loop()
+    cached = _tool_semaphores.get(tool_name)
+    if cached is None or cached[0] is not loop:
+        cached = (loop, asyncio.Semaphore(limit))
+        _tool_semaphores[tool_name] = cached
+    return cached[1]
+
+
+# Rate limits and timeouts from upstream APIs — logged without a traceback.
+_TRANSIENT_TOOL_ERRORS: tuple[type[BaseException], ...] = (
+    httpx.TimeoutException,
+    asyncio.TimeoutError,
+    TavilyTimeoutError,
+    UsageLimitExceededError,
+)
+
+
+def _is_transient_tool_error(exc: BaseException) -> bool:
+    if isinstance(exc, _TRANSIENT_TOOL_ERRORS):
+        return True
+    return (
+        isinstance(exc, httpx.HTTPStatusError)
+        and exc.response.status_code == 429
+    )
+
+
+def _tool_call_key(tool_name: str, tool_input: dict[str, Any]) -> str:
+    """Canonical key for a tool call, used to coalesce duplicates in a turn."""
+    return tool_name + ":" + json.dumps(tool_input, sort_keys=True, default=str)
+
+
+def _normalize_search_query(query: str) -> str:
+    """Collapse case and whitespace so trivially different searches match.
+
+    Word order is kept: "flights from X to Y" and "flights from Y to X"
+    are different searches.
+    """
+    return " ".join(query.lower().split())
+
+
+def _tool_cache_key(tool_name: str, tool_input: dict[str, Any]) -> str:
+    """Content-addressed key for the cross-turn tool result cache."""
+    if tool_name == "tavily_search" and isinstance(tool_input.get("query"), str):
+        tool_input = {
+            **tool_input,
+            "query": _normalize_search_query(tool_input["query"]),
+        }
+    payload = json.dumps(tool_input, sort_keys=True, default=str)
+    return tool_name + ":" + hashlib.sha256(payload.encode()).hexdigest()
+
+
 # ── The Agent ────────────────────────────────────────────────────────────────
 
 
@@ -481,6 +615,7 @@ class NexusAgent:
         reka: RekaClient | None = None,
         mode: NexusMode | None = None,
         ws_broadcast: Any | None = None,
+        save_event_context: Any | None = None,
     ) -> None:
         self.user = user_profile
         self.mode = mode or settings.nexus_mode
@@ -493,18 +628,58 @@ class NexusAgent:
         self._neo4j = neo4j
         self._reka = reka
 
-        # WebSocket broadcaster for real-time UI updates
+        # WebSocket broadcaster for real-time UI updates. Events are queued
+        # and flushed in short windows so tool bursts go out as one frame.
         self._ws_broadcast = ws_broadcast
+        self._ws_outbox: asyncio.Queue[dict[str, Any]] | None = None
+        self._ws_flusher_task: asyncio.Task[None] | None = None
+
+        # Last suggested event (date/location fallback for apply events).
+        # Kept in memory; the optional saver persists it across restarts.
+        self._last_event_context: dict[str, Any] = {}
+        self._save_event_context = save_event_context
+
+        # Tool name -> implementation / WebSocket event emitter
+        self._tool_handlers: dict[
+            str, Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
+        ] = {
+            "tavily_search": self._exec_tavily_search,
+            "yutori_browse": self._exec_yutori_browse,
+            "yutori_scout": self._exec_yutori_scout,
+            "reka_vision": self._exec_reka_vision,
+            "neo4j_query": self._exec_neo4j_query,
+            "neo4j_write": self._exec_neo4j_write,
+            "google_calendar": self._exec_google_calendar,
+            "resolve_social_accounts": self._exec_resolve_social,
+            "draft_message": self._exec_draft_message,
+            "get_user_feedback": self._exec_get_feedback,
+            "notify_user": self._exec_notify_user,
+            "wait": self._exec_wait,
+        }
+        self._tool_emitters: dict[
+            str, Callable[[dict[str, Any], dict[str, Any]], None]
+        ] = {
+            "tavily_search": self._emit_tavily_search,
+            "yutori_browse": self._emit_yutori_browse,
+            "yutori_scout": self._emit_yutori_scout,
+            "neo4j_write": self._emit_neo4j_write,
+            "neo4j_query": self._emit_neo4j_query,
+            "draft_message": self._emit_draft_message,
+            "resolve_social_accounts": self._emit_resolve_social_accounts,
+            "google_calendar": self._emit_google_calendar,
+        }
 
-        # Anthropic client
-        self._anthropic = anthropic.AsyncAnthropic(
-            api_key=settings.anthropic_api_key or "dummy",
-        )
+        # Memoized results of read-only tools: key -> (stored_at, result)
+        self._tool_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+        # Anthropic client (shared connection pool across agents)
+        self._anthropic = get_anthropic()
 
         # Counters for safety limits
         self._applies_today = 0
         self._messages_today = 0
         self._last_reset_date: str = ""
+        self._counter_lock = asyncio.Lock()
 
     # ── Properties ───────────────────────────────────────────────────────
 
@@ -572,6 +747,21 @@ class NexusAgent:
                 return False
         return True
 
+    async def _reserve_canary_slot(self, tool_name: str) -> bool:
+        """Atomically check canary limits and reserve a slot for this call.
+
+        Reserving before dispatch (rather than counting after success) keeps
+        concurrent tool calls from overshooting the daily limit.
+        """
+        async with self._counter_lock:
+            if not self._check_canary_limits(tool_name):
+                return False
+            if tool_name == "yutori_browse":
+                self._applies_today += 1
+            elif tool_name == "notify_user":
+                self._messages_today += 1
+            return True
+
     # ── Main loop ────────────────────────────────────────────────────────
 
     async def run_forever(self) -> None:
@@ -592,12 +782,7 @@ class NexusAgent:
                     "role": "user",
                     "content": (
                         f"You just started. Current time: {datetime.now(timezone.utc).isoformat()}. "
-                        f"Begin your autonomous cycle:\n"
-                        f"1. Search for upcoming events in SF matching my interests (1-2 tavily_search calls)\n"
-                        f"2. Pick the most relevant events and APPLY to them using yutori_browse\n"
-                        f"3. Save applied events to Neo4j\n"
-                        f"4. Research attendees at applied events\n"
-                        f"Start now — search for events, then apply to the best ones."
+                        f"{_KICKOFF_BODY}"
                     ),
                 }
             ]
@@ -607,8 +792,14 @@ class NexusAgent:
                 response = await self._anthropic.messages.create(
                     model="claude-opus-4-20250514",
                     max_tokens=4096,
-                    system=self.build_system_prompt(),
-                    tools=TOOLS,  # type: ignore[arg-type]
+                    system=[
+                        {
+                            "type": "text",
+                            "text": self.build_system_prompt(),
+                            "cache_control": {"type": "ephemeral"},
+                        }
+                    ],
+                    tools=_CACHED_TOOLS,  # type: ignore[arg-type]
                     messages=self.conversation_history,  # type: ignore[arg-type]
                 )
 
@@ -626,6 +817,8 @@ class NexusAgent:
                 # Handle tool calls
                 if response.stop_reason == "tool_use":
                     tool_results: list[dict[str, Any]] = []
+                    # Identical calls within one turn share a single execution
+                    turn_results: dict[str, dict[str, Any]] = {}
                     for block in response.content:
                         if not self.running:
                             break
@@ -633,9 +826,17 @@ class NexusAgent:
                             logger.info(
                                 "[AGENT] Using tool: %s", block.name
                             )
-                            result = await self.execute_tool(
-                                block.name, block.input  # type: ignore[arg-type]
-                            )
+                            tool_input = cast(dict[str, Any], block.input)
+                            key = _tool_call_key(block.name, tool_input)
+                            result = turn_results.get(key)
+                            if result is None:
+                                result = await self.execute_tool(block.name, tool_input)
+                                turn_results[key] = result
+                            else:
+                                logger.info(
+                                    "[AGENT] Reusing result for duplicate %s call",
+                                    block.name,
+                                )
                             tool_results.append(
                                 {
                                     "type": "tool_result",
@@ -646,10 +847,8 @@ class NexusAgent:
 
                             # Handle wait tool — sleep in chunks so pause works
                             if block.name == "wait":
-                                hours = float(block.input.get("hours", 1))  # type: ignore[union-attr]
-                                reason = block.input.get(  # type: ignore[union-attr]
-                                    "reason", "cycle complete"
-                                )
+                                hours = float(tool_input.get("hours", 1))
+                                reason = tool_input.get("reason", "cycle complete")
                                 logger.info(
                                     "[AGENT] Waiting %.1fh — %s",
                                     hours,
@@ -667,11 +866,12 @@ class NexusAgent:
 
                 elif response.stop_reason == "end_turn":
                     # Log Claude's thinking
-                    for block in response.content:
-                        if block.type == "text":
-                            logger.info(
-                                "[AGENT] Thinking: %s", block.text[:200]
-                            )
+                    if logger.isEnabledFor(logging.INFO):
+                        for block in response.content:
+                            if block.type == "text":
+                                logger.info(
+                                    "[AGENT] Thinking: %s", block.text[:200]
+                                )
 
                     # Feed new cycle prompt — push toward action
                     self.conversation_history.append(
@@ -679,10 +879,7 @@ class NexusAgent:
                             "role": "user",
                             "content": (
                                 f"Current time: {datetime.now(timezone.utc).isoformat()}. "
-                                f"Continue your cycle. If you found events, APPLY to the best ones "
-                                f"using yutori_browse NOW. If you already applied, research the "
-                                f"attendees. If you've done both, draft messages for interesting "
-                                f"people, then wait 1-2 hours."
+                                f"{_CONTINUE_BODY}"
                             ),
                         }
                     )
@@ -694,13 +891,21 @@ class NexusAgent:
                 logger.info("[AGENT] Loop cancelled (paused/stopped)")
                 raise  # Let it propagate so the task ends cleanly
             except anthropic.APIError as e:
-                logger.error("[AGENT] API error: %s. Recovering in 60s...", e)
+                logger.error(
+                    "[AGENT] API error: %s. Recovering in 60s...",
+                    e,
+                    extra={"exc": type(e).__name__},
+                )
                 for _ in range(60):
                     if not self.running:
                         break
                     await asyncio.sleep(1)
             except Exception as e:
-                logger.error("[AGENT] Error: %s. Recovering in 60s...", e)
+                logger.error(
+                    "[AGENT] Error: %s. Recovering in 60s...",
+                    e,
+                    extra={"exc": type(e).__name__},
+                )
                 for _ in range(60):
                     if not self.running:
                         break
@@ -711,6 +916,65 @@ class NexusAgent:
 
     def resume(self) -> None:
         self.running = True
+        self.clear_tool_cache()
+
+    def clear_tool_cache(self) -> None:
+        """Drop memoized tool results so the next reads hit upstream."""
+        self._tool_cache.clear()
+
+    # ── WebSocket event batching ─────────────────────────────────────────
+
+    def _emit(self, message: dict[str, Any]) -> None:
+        """Queue a WebSocket event; the flusher task sends it shortly."""
+        if not self._ws_broadcast:
+            return
+        if self._ws_flusher_task is None or self._ws_flusher_task.done():
+            self._ws_outbox = asyncio.Queue()
+            self._ws_flusher_task = asyncio.create_task(self._ws_flusher())
+        assert self._ws_outbox is not None
+        self._ws_outbox.put_nowait(message)
+
+    async def _ws_flusher(self) -> None:
+        assert self._ws_outbox is not None
+        outbox = self._ws_outbox
+        while True:
+            batch = [await outbox.get()]
+            try:
+                # Give the rest of a tool burst a moment to queue up
+                await asyncio.sleep(_WS_BATCH_WINDOW)
+            finally:
+                while not outbox.empty():
+                    batch.append(outbox.get_nowait())
+                await self._send_ws_batch(batch)
+
+    async def _send_ws_batch(self, batch: list[dict[str, Any]]) -> None:
+        if not self._ws_broadcast or not batch:
+            return
+        message = (
+            batch[0] if len(batch) == 1 else {"type": "batch", "events": batch}
+        )
+        try:
+            await self._ws_broadcast(message)
+        except Exception:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("WebSocket broadcast failed", exc_info=True)
+
+    async def flush_ws_events(self) -> None:
+        """Stop the flusher and send anything still queued."""
+        task, self._ws_flusher_task = self._ws_flusher_task, None
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        outbox, self._ws_outbox = self._ws_outbox, None
+        if outbox is None:
+            return
+        pending: list[dict[str, Any]] = []
+        while not outbox.empty():
+            pending.append(outbox.get_nowait())
+        await self._send_ws_batch(pending)
 
     # ── Tool execution router ────────────────────────────────────────────
 
@@ -732,44 +996,44 @@ class NexusAgent:
                 "reason": f"Side effects disabled in {self.mode.value} mode",
             }
 
-        # Enforce canary limits
-        if not self._check_canary_limits(tool_name):
+        # Enforce canary limits (reserves a slot before dispatch)
+        if not await self._reserve_canary_slot(tool_name):
             return {
                 "status": "blocked",
                 "reason": "Daily limit reached in canary mode",
             }
 
         # Broadcast tool start via WebSocket
-        if self._ws_broadcast:
-            await self._ws_broadcast(
-                {
-                    "type": "agent:status",
-                    "data": {
-                        "status": "running",
-                        "agent": "wingman",
-                        "tool": tool_name,
-                    },
-                }
-            )
+        self._emit(
+            {
+                "type": "agent:status",
+                "data": {
+                    "status": "running",
+                    "agent": "wingman",
+                    "tool": tool_name,
+                },
+            }
+        )
 
         try:
-            result = await self._dispatch_tool(tool_name, tool_input)
-            # Increment counters for canary mode
-            if tool_name == "yutori_browse":
-                self._applies_today += 1
+            result = await self._memoized_dispatch(tool_name, tool_input)
 
             # Broadcast tool-specific events
             if self._ws_broadcast:
-                await self._broadcast_tool_event(tool_name, tool_input, result)
+                self._broadcast_tool_event(tool_name, tool_input, result)
 
             return result
         except Exception as e:
-            logger.error(
-                "[AGENT] Tool %s failed: %s", tool_name, e, exc_info=True
-            )
+            if _is_transient_tool_error(e):
+                # Expected under load — skip the traceback formatting
+                logger.warning("[AGENT] Tool %s failed: %r", tool_name, e)
+            else:
+                logger.error(
+                    "[AGENT] Tool %s failed: %s", tool_name, e, exc_info=True
+                )
             return {"error": str(e), "tool": tool_name}
 
-    async def _broadcast_tool_event(
+    def _broadcast_tool_event(
         self,
         tool_name: str,
         tool_input: dict[str, Any],
@@ -778,180 +1042,197 @@ class NexusAgent:
         """Broadcast specific WebSocket events based on tool results."""
         if not self._ws_broadcast:
             return
+        emitter = self._tool_emitters.get(tool_name)
+        if emitter:
+            emitter(tool_input, result)
 
-        if tool_name == "tavily_search":
-            raw_results = result.get("results", [])
-            count = len(raw_results)
-            top_results = raw_results[:5]
-            await self._ws_broadcast(
-                {
-                    "type": "event:discovered",
-                    "data": {
-                        "event": {"title": tool_input.get("query", "search")},
-                        "count": count,
-                        "search_results": top_results,
-                        "agent": "wingman",
-                    },
-                }
-            )
-        elif tool_name == "yutori_browse":
-            task_desc = tool_input.get("task", "")
-            url = tool_input.get("start_url", "")
-            # If the task mentions apply/RSVP, it's an application
-            is_apply = any(
-                kw in task_desc.lower()
-                for kw in ["apply", "rsvp", "register", "sign up", "attend"]
+    def _emit_tavily_search(
+        self, tool_input: dict[str, Any], result: dict[str, Any]
+    ) -> None:
+        raw_results = result.get("results", [])
+        count = len(raw_results)
+        top_results = raw_results[:5]
+        self._emit(
+            {
+                "type": "event:discovered",
+                "data": {
+                    "event": {"title": tool_input.get("query", "search")},
+                    "count": count,
+                    "search_results": top_results,
+                    "agent": "wingman",
+                },
+            }
+        )
+
+    def _emit_yutori_browse(
+        self, tool_input: dict[str, Any], result: dict[str, Any]
+    ) -> None:
+        task_desc = tool_input.get("task", "")
+        url = tool_input.get("start_url", "")
+        # If the task mentions apply/RSVP, it's an application
+        if _APPLY_RE.search(task_desc):
+            browse_result = result.get("result")
+            br = browse_result if isinstance(browse_result, dict) else {}
+            # Fall back to the last analyzed event context for date/location
+            lc = self._last_event_context
+            payment_required = br.get("payment_required", False)
+            payment_amount = br.get("payment_amount")
+            event_date = br.get("date") or br.get("event_date") or lc.get("date")
+            event_location = (
+                br.get("location") or br.get("venue") or lc.get("location")
             )
-            if is_apply:
-                browse_result = result.get("result") or {}
-                payment_required = False
-                payment_amount = None
-                event_date = None
-                event_location = None
-                if isinstance(browse_result, dict):
-                    payment_required = browse_result.get("payment_required", False)
-                    payment_amount = browse_result.get("payment_amount")
-                    event_date = browse_result.get("date") or browse_result.get("event_date")
-                    event_location = browse_result.get("location") or browse_result.get("venue")
-                # Also try to get from the last analyzed event context
-                last_ctx = getattr(self, "_last_event_context", {})
-                if not event_date and isinstance(last_ctx, dict):
-                    event_date = last_ctx.get("date")
-                if not event_location and isinstance(last_ctx, dict):
-                    event_location = last_ctx.get("location")
-                event_data: dict[str, Any] = {"title": task_desc[:100], "url": url}
-                if event_date:
-                    event_data["date"] = event_date
-                if event_location:
-                    event_data["location"] = event_location
-                await self._ws_broadcast(
-                    {
-                        "type": "event:applied",
-                        "data": {
-                            "event": event_data,
-                            "status": result.get("status", "pending"),
-                            "payment_required": payment_required,
-                            "payment_amount": payment_amount,
-                            "agent": "wingman",
-                        },
-                    }
-                )
-            else:
-                await self._ws_broadcast(
-                    {
-                        "type": "person:discovered",
-                        "data": {
-                            "person": {"name": f"Browsing: {task_desc[:80]}"},
-                            "url": url,
-                            "agent": "wingman",
-                        },
-                    }
-                )
-        elif tool_name == "yutori_scout":
-            await self._ws_broadcast(
+            event_data: dict[str, Any] = {"title": task_desc[:100], "url": url}
+            if event_date:
+                event_data["date"] = event_date
+            if event_location:
+                event_data["location"] = event_location
+            self._emit(
                 {
-                    "type": "event:discovered",
+                    "type": "event:applied",
                     "data": {
-                        "event": {"title": f"Scout: {tool_input.get('task', '')[:80]}"},
+                        "event": event_data,
+                        "status": result.get("status", "pending"),
+                        "payment_required": payment_required,
+                        "payment_amount": payment_amount,
                         "agent": "wingman",
                     },
                 }
             )
-        elif tool_name == "neo4j_write":
-            await self._ws_broadcast(
+        else:
+            self._emit(
                 {
                     "type": "person:discovered",
                     "data": {
-                        "person": {"name": "graph updated"},
+                        "person": {"name": f"Browsing: {task_desc[:80]}"},
+                        "url": url,
                         "agent": "wingman",
                     },
                 }
             )
-        elif tool_name == "neo4j_query":
-            count = result.get("count", 0)
-            await self._ws_broadcast(
-                {
-                    "type": "agent:status",
-                    "data": {
-                        "status": "running",
-                        "agent": "wingman",
-                        "tool": "neo4j_query",
-                        "detail": f"Found {count} records",
-                    },
-                }
-            )
-        elif tool_name == "draft_message":
-            await self._ws_broadcast(
-                {
-                    "type": "message:drafted",
-                    "data": {
-                        "channel": result.get("channel", ""),
-                        "type": result.get("message_type", ""),
-                        "agent": "wingman",
-                    },
-                }
-            )
-        elif tool_name == "resolve_social_accounts":
-            name = tool_input.get("name", "")
-            links = result.get("social_links", {})
-            found = [k for k, v in links.items() if v]
-            await self._ws_broadcast(
+
+    def _emit_yutori_scout(
+        self, tool_input: dict[str, Any], result: dict[str, Any]
+    ) -> None:
+        self._emit(
+            {
+                "type": "event:discovered",
+                "data": {
+                    "event": {"title": f"Scout: {tool_input.get('task', '')[:80]}"},
+                    "agent": "wingman",
+                },
+            }
+        )
+
+    def _emit_neo4j_write(
+        self, tool_input: dict[str, Any], result: dict[str, Any]
+    ) -> None:
+        self._emit(
+            {
+                "type": "person:discovered",
+                "data": {
+                    "person": {"name": "graph updated"},
+                    "agent": "wingman",
+                },
+            }
+        )
+
+    def _emit_neo4j_query(
+        self, tool_input: dict[str, Any], result: dict[str, Any]
+    ) -> None:
+        count = result.get("count", 0)
+        self._emit(
+            {
+                "type": "agent:status",
+                "data": {
+                    "status": "running",
+                    "agent": "wingman",
+                    "tool": "neo4j_query",
+                    "detail": f"Found {count} records",
+                },
+            }
+        )
+
+    def _emit_draft_message(
+        self, tool_input: dict[str, Any], result: dict[str, Any]
+    ) -> None:
+        self._emit(
+            {
+                "type": "message:drafted",
+                "data": {
+                    "channel": result.get("channel", ""),
+                    "type": result.get("message_type", ""),
+                    "agent": "wingman",
+                },
+            }
+        )
+
+    def _emit_resolve_social_accounts(
+        self, tool_input: dict[str, Any], result: dict[str, Any]
+    ) -> None:
+        name = tool_input.get("name", "")
+        links = result.get("social_links", {})
+        found = [k for k, v in links.items() if v]
+        self._emit(
+            {
+                "type": "person:discovered",
+                "data": {
+                    "person": {"name": name},
+                    "socials_found": found,
+                    "agent": "wingman",
+                },
+            }
+        )
+
+    def _emit_google_calendar(
+        self, tool_input: dict[str, Any], result: dict[str, Any]
+    ) -> None:
+        action = tool_input.get("action", "")
+        if action == "create_event":
+            self._emit(
                 {
-                    "type": "person:discovered",
+                    "type": "event:scheduled",
                     "data": {
-                        "person": {"name": name},
-                        "socials_found": found,
+                        "event": tool_input.get("event_data", {}),
                         "agent": "wingman",
                     },
                 }
             )
-        elif tool_name == "google_calendar":
-            action = tool_input.get("action", "")
-            if action == "create_event":
-                await self._ws_broadcast(
-                    {
-                        "type": "event:scheduled",
-                        "data": {
-                            "event": tool_input.get("event_data", {}),
-                            "agent": "wingman",
-                        },
-                    }
-                )
+
+    async def _memoized_dispatch(
+        self, tool_name: str, tool_input: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Dispatch a tool, serving repeat read-only calls from the cache."""
+        key = None
+        if tool_name in _MEMOIZABLE_TOOLS:
+            key = _tool_cache_key(tool_name, tool_input)
+            hit = self._tool_cache.get(key)
+            if hit and time.monotonic() - hit[0] < _TOOL_CACHE_TTL:
+                return hit[1]
+
+        async with _tool_semaphore(tool_name) or nullcontext():
+            result = await self._dispatch_tool(tool_name, tool_input)
+
+        if key is not None and "error" not in result:
+            self._tool_cache[key] = (time.monotonic(), result)
+        elif tool_name in _CACHE_INVALIDATING_TOOLS:
+            self.clear_tool_cache()
+        return result
 
     async def _dispatch_tool(
         self, tool_name: str, tool_input: dict[str, Any]
     ) -> dict[str, Any]:
         """Internal dispatcher to integration clients."""
 
-        if tool_name == "tavily_search":
-            return await self._exec_tavily_search(tool_input)
-        elif tool_name == "yutori_browse":
-            return await self._exec_yutori_browse(tool_input)
-        elif tool_name == "yutori_scout":
-            return await self._exec_yutori_scout(tool_input)
-        elif tool_name == "reka_vision":
-            return await self._exec_reka_vision(tool_input)
-        elif tool_name == "neo4j_query":
-            return await self._exec_neo4j_query(tool_input)
-        elif tool_name == "neo4j_write":
-            return await self._exec_neo4j_write(tool_input)
-        elif tool_name == "google_calendar":
-            return await self._exec_google_calendar(tool_input)
-        elif tool_name == "resolve_social_accounts":
-            return await self._exec_resolve_social(tool_input)
-        elif tool_name == "draft_message":
-            return await self._exec_draft_message(tool_input)
-        elif tool_name == "get_user_feedback":
-            return await self._exec_get_feedback(tool_input)
-        elif tool_name == "notify_user":
-            return await self._exec_notify_user(tool_input)
-        elif tool_name == "wait":
-            return {"status": "waited", "hours": tool_input.get("hours", 1)}
-        else:
+        handler = self._tool_handlers.get(tool_name)
+        if handler is None:
             return {"error": f"Unknown tool: {tool_name}"}
+        return await handler(tool_input)
 
     # ── Tool implementations ─────────────────────────────────────────────
 
+    async def _exec_wait(self, inp: dict[str, Any]) -> dict[str, Any]:
+        return {"status": "waited", "hours": inp.get("hours", 1)}
+
     async def _exec_tavily_search(
         self, inp: dict[str, Any]
     ) -> dict[str, Any]:
@@ -971,9 +1252,9 @@ class NexusAgent:
             "answer": result.answer,
             "results": [
                 {
-                    "title": r.get("title", ""),
-                    "url": r.get("url", ""),
-                    "content": r.get("content", "")[:500],
+                    "title": r.get("title") or "",
+                    "url": r.get("url") or "",
+                    "content": (r.get("content") or "")[:_SEARCH_CONTENT_CHARS],
                 }
                 for r in result.results
             ],
@@ -1074,21 +1355,29 @@ class NexusAgent:
         }
 
         if self._tavily:
-            # Search for LinkedIn
-            query = f"{name} {company} {title} LinkedIn"
-            result = await self._tavily.search(
-                query=query, max_results=3, include_domains=["linkedin.com"]
-            )
-            if result.results:
-                links["linkedin"] = result.results[0].get("url")
-
-            # Search for Twitter/X
-            query = f"{name} {company} Twitter OR X site:x.com"
-            result = await self._tavily.search(
-                query=query, max_results=3, include_domains=["x.com"]
+            # LinkedIn and Twitter/X lookups are independent; run them together
+            searches = {
+                "linkedin": self._tavily.search(
+                    query=f"{name} {company} {title} LinkedIn",
+                    max_results=3,
+                    include_domains=["linkedin.com"],
+                ),
+                "twitter": self._tavily.search(
+                    query=f"{name} {company} Twitter OR X site:x.com",
+                    max_results=3,
+                    include_domains=["x.com"],
+                ),
+            }
+            results = await asyncio.gather(
+                *searches.values(), return_exceptions=True
             )
-            if result.results:
-                links["twitter"] = result.results[0].get("url")
+            for platform, result in zip(searches, results):
+                if isinstance(result, BaseException):
+                    logger.warning(
+                        "[AGENT] %s lookup for %s failed: %r", platform, name, result
+                    )
+                elif result.results:
+                    links[platform] = result.results[0].get("url")
 
         return {"name": name, "social_links": links}
 
@@ -1126,27 +1415,23 @@ class NexusAgent:
                     "title": ev.get("title"),
                     "url": ev.get("url"),
                 }
+                if self._save_event_context:
+                    await self._save_event_context(self._last_event_context)
 
-        # Map agent notify_user types to standard WS event types
-        type_mapping: dict[str, str] = {
-            "event_suggested": "event:analyzed",
-            "event_applied": "event:applied",
-        }
-        ws_type = type_mapping.get(notification_type, notification_type)
+        ws_type = _WS_TYPE_MAP.get(notification_type, notification_type)
 
         # Ensure agent field is set
         if isinstance(data, dict):
             data.setdefault("agent", "wingman")
 
         # Broadcast via WebSocket if available
-        if self._ws_broadcast:
-            await self._ws_broadcast(
-                {
-                    "type": ws_type,
-                    "data": data,
-                    "priority": priority,
-                }
-            )
+        self._emit(
+            {
+                "type": ws_type,
+                "data": data,
+                "priority": priority,
+            }
+        )
 
         return {
             "status": "notified",
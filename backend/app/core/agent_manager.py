@@ -10,12 +10,15 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from typing import Any
 
+import orjson
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.core.config import settings
-from app.core.database import async_session_factory
+from app.core.database import async_ro_session_factory, async_session_factory
 from app.core.websocket import manager
 from app.models.agent_state import AgentStateDB
 from app.models.profile import UserProfileDB
@@ -23,6 +26,26 @@ from app.models.profile import UserProfileDB
 logger = logging.getLogger(__name__)
 
 _STATE_KEY = "agent_status"
+_EVENT_CTX_KEY = "last_event_ctx"
+_PROFILE_CACHE_TTL = 30.0  # seconds
+
+# Only the profile fields the agent prompt actually uses
+_PROFILE_COLUMNS = (
+    UserProfileDB.name,
+    UserProfileDB.email,
+    UserProfileDB.role,
+    UserProfileDB.company,
+    UserProfileDB.product_description,
+    UserProfileDB.interests,
+    UserProfileDB.networking_goals,
+    UserProfileDB.target_roles,
+    UserProfileDB.target_companies,
+    UserProfileDB.preferred_event_types,
+    UserProfileDB.max_events_per_week,
+    UserProfileDB.auto_apply_threshold,
+    UserProfileDB.suggest_threshold,
+    UserProfileDB.message_tone,
+)
 
 
 class AgentManager:
@@ -32,37 +55,63 @@ class AgentManager:
         self._agent: Any = None  # NexusAgent (lazy import to avoid circular)
         self._task: asyncio.Task[None] | None = None
         self._status = "idle"
+        # Neo4j client (and its driver pool) is kept across stop/start cycles
+        self._neo4j: Any = None
+        self._profile_cache: dict[str, Any] | None = None
+        self._profile_cache_ts = 0.0
 
     # ── DB state helpers ───────────────────────────────────────────
 
-    async def _load_persisted_status(self) -> str | None:
-        """Read agent status from DB. Returns None if no row exists."""
+    async def _load_state(self, key: str) -> str | None:
+        """Read a value from the agent_state table. None if no row exists."""
         try:
-            async with async_session_factory() as session:
+            async with async_ro_session_factory() as session:
                 result = await session.execute(
-                    select(AgentStateDB).where(AgentStateDB.key == _STATE_KEY)
+                    select(AgentStateDB.value).where(AgentStateDB.key == key)
                 )
-                row = result.scalar_one_or_none()
-                return row.value if row else None
+                return result.scalar_one_or_none()
         except Exception:
-            logger.debug("Failed to read persisted agent state", exc_info=True)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Failed to read persisted agent state", exc_info=True)
             return None
 
-    async def _persist_status(self, value: str) -> None:
-        """Upsert agent status to DB."""
+    async def _save_state(self, key: str, value: str) -> None:
+        """Upsert a value into the agent_state table."""
+        stmt = (
+            pg_insert(AgentStateDB)
+            .values(key=key, value=value)
+            .on_conflict_do_update(
+                index_elements=[AgentStateDB.key], set_={"value": value}
+            )
+        )
         try:
             async with async_session_factory() as session:
-                result = await session.execute(
-                    select(AgentStateDB).where(AgentStateDB.key == _STATE_KEY)
-                )
-                row = result.scalar_one_or_none()
-                if row:
-                    row.value = value
-                else:
-                    session.add(AgentStateDB(key=_STATE_KEY, value=value))
+                await session.execute(stmt)
                 await session.commit()
         except Exception:
-            logger.debug("Failed to persist agent state", exc_info=True)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Failed to persist agent state", exc_info=True)
+
+    async def _load_persisted_status(self) -> str | None:
+        """Read agent status from DB. Returns None if no row exists."""
+        return await self._load_state(_STATE_KEY)
+
+    async def _persist_status(self, value: str) -> None:
+        """Upsert agent status to DB."""
+        await self._save_state(_STATE_KEY, value)
+
+    async def _load_event_context(self) -> dict[str, Any] | None:
+        raw = await self._load_state(_EVENT_CTX_KEY)
+        if not raw:
+            return None
+        try:
+            ctx = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return None
+        return ctx if isinstance(ctx, dict) else None
+
+    async def _save_event_context(self, ctx: dict[str, Any]) -> None:
+        await self._save_state(_EVENT_CTX_KEY, orjson.dumps(ctx, default=str).decode())
 
     # ── Properties ────────────────────────────────────────────────────
 
@@ -153,19 +202,25 @@ class AgentManager:
             except Exception:
                 logger.warning("Yutori client init failed")
 
-        neo4j = None
-        if settings.neo4j_uri and settings.neo4j_password:
+        if self._neo4j is None and settings.neo4j_uri and settings.neo4j_password:
+            neo4j = Neo4jClient(
+                uri=settings.neo4j_uri,
+                user=settings.neo4j_user,
+                password=settings.neo4j_password,
+                max_pool_size=settings.neo4j_max_pool_size,
+                acquisition_timeout=settings.neo4j_acquisition_timeout_s,
+            )
             try:
-                neo4j = Neo4jClient(
-                    uri=settings.neo4j_uri,
-                    user=settings.neo4j_user,
-                    password=settings.neo4j_password,
-                )
                 await neo4j.connect()
+                await neo4j.verify_connectivity()
+                self._neo4j = neo4j
                 logger.info("[WINGMAN] Neo4j connected")
             except Exception:
                 logger.warning("Neo4j client init/connect failed", exc_info=True)
-                neo4j = None
+                try:
+                    await neo4j.disconnect()
+                except Exception:
+                    pass
 
         reka = None
         if settings.reka_api_key:
@@ -178,11 +233,15 @@ class AgentManager:
             user_profile=user_profile,
             tavily=tavily,
             yutori=yutori,
-            neo4j=neo4j,
+            neo4j=self._neo4j,
             reka=reka,
             ws_broadcast=manager.broadcast,
+            save_event_context=self._save_event_context,
             mode=settings.nexus_mode,
         )
+        event_ctx = await self._load_event_context()
+        if event_ctx:
+            self._agent._last_event_context = event_ctx
 
     async def _run_agent(self) -> None:
         try:
@@ -204,11 +263,7 @@ class AgentManager:
         """Gracefully stop the agent."""
         if self._agent:
             self._agent.pause()
-            if self._agent._neo4j:
-                try:
-                    await self._agent._neo4j.disconnect()
-                except Exception:
-                    pass
+            await self._agent.flush_ws_events()
         if self._task:
             self._task.cancel()
             try:
@@ -224,6 +279,15 @@ class AgentManager:
             }
         )
 
+    async def close(self) -> None:
+        """Release the shared Neo4j driver pool (called on app shutdown)."""
+        if self._neo4j is not None:
+            try:
+                await self._neo4j.disconnect()
+            except Exception:
+                pass
+            self._neo4j = None
+
     async def pause(self) -> None:
         if self._agent:
             self._agent.pause()
@@ -236,6 +300,8 @@ class AgentManager:
             except asyncio.CancelledError:
                 pass
             self._task = None
+        if self._agent:
+            await self._agent.flush_ws_events()
 
         self._status = "paused"
         await self._persist_status("paused")
@@ -298,18 +364,29 @@ class AgentManager:
 
     # ── Helpers ───────────────────────────────────────────────────────
 
+    def invalidate_profile_cache(self) -> None:
+        """Forget the cached profile; call after UserProfileDB changes."""
+        self._profile_cache = None
+        self._profile_cache_ts = 0.0
+
     async def _load_user_profile(self) -> dict[str, Any] | None:
-        """Load the first onboarded user profile from DB."""
-        async with async_session_factory() as session:
+        """Load the first onboarded user profile from DB (cached briefly)."""
+        if (
+            self._profile_cache is not None
+            and time.monotonic() - self._profile_cache_ts < _PROFILE_CACHE_TTL
+        ):
+            return self._profile_cache
+
+        async with async_ro_session_factory() as session:
             result = await session.execute(
-                select(UserProfileDB)
+                select(*_PROFILE_COLUMNS)
                 .where(UserProfileDB.onboarding_completed.is_(True))
                 .limit(1)
             )
-            user = result.scalar_one_or_none()
+            user = result.first()
             if not user:
                 return None
-            return {
+            profile = {
                 "name": user.name,
                 "email": user.email,
                 "role": user.role,
@@ -325,6 +402,9 @@ class AgentManager:
                 "suggest_threshold": user.suggest_threshold,
                 "message_tone": user.message_tone,
             }
+        self._profile_cache = profile
+        self._profile_cache_ts = time.monotonic()
+        return profile
 
 
 # Global singleton
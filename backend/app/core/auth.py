@@ -1,29 +1,45 @@
 from __future__ import annotations
 
+import time
 from datetime import datetime, timedelta, timezone
 
+import jwt
 from fastapi import HTTPException, Request, status
-from jose import JWTError, jwt
 
 from app.core.config import settings
 
+# Settings are frozen, so JWT parameters are bound once at import
+_JWT_KEY = settings.jwt_secret_key.encode()
+_JWT_ALGORITHM = settings.jwt_algorithm
+_JWT_ALGORITHMS = [_JWT_ALGORITHM]
+_JWT_TTL = timedelta(minutes=settings.jwt_expire_minutes)
+
+# Verified tokens -> (exp timestamp, claims), evicted oldest-first
+_DECODE_CACHE_SIZE = 4096
+_decode_cache: dict[str, tuple[float, dict[str, str]]] = {}
+
 
 def create_access_token(user_id: str, email: str) -> str:
     """Create a JWT access token with user_id and email claims."""
-    expire = datetime.now(timezone.utc) + timedelta(minutes=settings.jwt_expire_minutes)
+    expire = datetime.now(timezone.utc) + _JWT_TTL
     payload = {
         "sub": user_id,
         "email": email,
         "exp": expire,
     }
-    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    return jwt.encode(payload, _JWT_KEY, algorithm=_JWT_ALGORITHM)
 
 
 def decode_access_token(token: str) -> dict[str, str]:
     """Decode and validate a JWT token. Returns {"user_id": ..., "email": ...}."""
+    cached = _decode_cache.get(token)
+    if cached is not None:
+        if cached[0] > time.time():
+            return dict(cached[1])
+        del _decode_cache[token]
     try:
         payload = jwt.decode(
-            token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm]
+            token, _JWT_KEY, algorithms=_JWT_ALGORITHMS, options={"require": ["exp"]}
         )
         user_id: str | None = payload.get("sub")
         email: str | None = payload.get("email")
@@ -32,13 +48,18 @@ def decode_access_token(token: str) -> dict[str, str]:
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token claims",
             )
-        return {"user_id": user_id, "email": email}
-    except JWTError:
+        claims = {"user_id": user_id, "email": email}
+    except jwt.PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
         )
 
+    if len(_decode_cache) >= _DECODE_CACHE_SIZE:
+        del _decode_cache[next(iter(_decode_cache))]
+    _decode_cache[token] = (float(payload["exp"]), claims)
+    return dict(claims)
+
 
 def get_token_from_cookie(request: Request) -> str:
     """Extract the access token from the httpOnly cookie."""
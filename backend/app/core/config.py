@@ -1,5 +1,7 @@
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -20,6 +22,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
 
     # Sponsor Tool API Keys
@@ -28,6 +31,8 @@ class Settings(BaseSettings):
     neo4j_uri: str = ""
     neo4j_user: str = "neo4j"
     neo4j_password: str = ""
+    neo4j_max_pool_size: int = 50
+    neo4j_acquisition_timeout_s: float = 60.0
     reka_api_key: str = ""
     anthropic_api_key: str = ""
 
@@ -43,6 +48,10 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "postgresql+asyncpg://localhost:5432/nexus"
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_timeout_s: float = 10.0
+    db_pool_recycle_s: int = 1800
 
     # App Config
     secret_key: str = "change-me-in-production"
@@ -50,6 +59,12 @@ class Settings(BaseSettings):
     backend_url: str = "http://localhost:8000"
     frontend_url: str = "http://localhost:3000"
 
+    # WebSocket fan-out: frames queued within the delay go out as one message
+    ws_batch_size: int = 50
+    ws_batch_delay_ms: int = 20
+    # "msgpack" shrinks frames; clients sniff the format per message
+    ws_wire_format: Literal["json", "msgpack"] = "json"
+
     # Safety Limits
     max_auto_applies_per_day: int = 10
     max_auto_send_messages_per_day: int = 5
@@ -64,4 +79,15 @@ class Settings(BaseSettings):
         return self.nexus_mode in (NexusMode.CANARY, NexusMode.LIVE)
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Process-wide Settings, parsed from the environment once."""
+    return Settings()
+
+
+def __getattr__(name: str) -> Settings:
+    # ``settings`` is resolved on first access, so importing this module
+    # (e.g. just for NexusMode) doesn't parse the environment
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,10 @@
+import enum
+import functools
 import ssl
 from collections.abc import AsyncGenerator
+from datetime import datetime, timezone
 
+from sqlalchemy import Connection, Enum, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -16,8 +20,12 @@ if "supabase" in settings.database_url:
 engine = create_async_engine(
     settings.database_url,
     echo=False,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout_s,
+    # Drop connections the server/proxy closed while idle before handing them out
+    pool_pre_ping=True,
+    pool_recycle=settings.db_pool_recycle_s,
     connect_args=connect_args,
 )
 
@@ -27,11 +35,84 @@ async_session_factory = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Read-only sessions: READ ONLY transactions, no autoflush. Use for lookups
+# that never write.
+async_ro_session_factory = async_sessionmaker(
+    engine.execution_options(postgresql_readonly=True),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
 
 class Base(DeclarativeBase):
     pass
 
 
+# Timezone-aware replacement for datetime.utcnow in model default factories
+utc_now = functools.partial(datetime.now, timezone.utc)
+
+
+@functools.cache
+def varchar_enum(enum_cls: type[enum.Enum]) -> Enum:
+    """Enum column stored as VARCHAR holding member values.
+
+    Avoids native PostgreSQL ENUM types, whose values can only be
+    extended with blocking ALTER TYPE migrations. Cached, so every column
+    of the same enum shares one type object.
+    """
+    return Enum(
+        enum_cls,
+        native_enum=False,
+        length=32,
+        values_callable=lambda members: [m.value for m in members],
+    )
+
+
+def create_missing_indexes(conn: Connection) -> None:
+    """Create model indexes absent from the database.
+
+    ``create_all`` only emits indexes together with new tables, so indexes
+    added to an existing model would otherwise never be created.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
+# uuid columns the app inserts without a value, relying on the database
+# default; create_all never adds one to an existing table
+_SERVER_GENERATED_IDS: tuple[tuple[str, str], ...] = (
+    ("agent_events", "id"),
+    ("chat_messages", "id"),
+    ("user_profiles", "id"),
+)
+
+_COLUMN_INFO = text(
+    "SELECT data_type, column_default FROM information_schema.columns "
+    "WHERE table_schema = current_schema() "
+    "AND table_name = :table AND column_name = :column"
+)
+
+
+def check_server_generated_ids(conn: Connection) -> None:
+    """Fail startup if an id the database must generate has no uuid default.
+
+    Databases created before these defaults existed need
+    ``scripts/migrate.py``; without it every insert into the table fails.
+    """
+    missing = []
+    for table, column in _SERVER_GENERATED_IDS:
+        row = conn.execute(_COLUMN_INFO, {"table": table, "column": column}).first()
+        if row is None or row.data_type != "uuid" or row.column_default is None:
+            missing.append(f"{table}.{column}")
+    if missing:
+        raise RuntimeError(
+            "Database schema is out of date (no uuid default on "
+            f"{', '.join(missing)}); run scripts/migrate.py"
+        )
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_factory() as session:
         yield session
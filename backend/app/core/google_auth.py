@@ -1,15 +1,24 @@
 from __future__ import annotations
 
+from typing import Any
+
 from google.oauth2.credentials import Credentials
 
-from app.core.config import settings
+from app.core.config import get_settings
 
-SCOPES = [
+SCOPES = (
     "openid",
     "https://www.googleapis.com/auth/userinfo.email",
     "https://www.googleapis.com/auth/userinfo.profile",
     "https://www.googleapis.com/auth/calendar.events",
-]
+)
+
+# Credential fields that never vary between users
+_STATIC_CRED_KWARGS: dict[str, Any] = {
+    "token": None,
+    "token_uri": "https://oauth2.googleapis.com/token",
+    "scopes": SCOPES,
+}
 
 
 def build_credentials_from_refresh_token(refresh_token: str) -> Credentials:
@@ -17,11 +26,10 @@ def build_credentials_from_refresh_token(refresh_token: str) -> Credentials:
 
     Used to make Calendar API calls on behalf of the user.
     """
+    settings = get_settings()
     return Credentials(
-        token=None,
         refresh_token=refresh_token,
-        token_uri="https://oauth2.googleapis.com/token",
         client_id=settings.google_client_id,
         client_secret=settings.google_client_secret,
-        scopes=SCOPES,
+        **_STATIC_CRED_KWARGS,
     )
@@ -0,0 +1,37 @@
+"""Shared httpx client.
+
+One AsyncClient (and therefore one HTTP/2 connection pool) is reused by
+every REST integration in the process, so keep-alive connections and TLS
+sessions survive across client instances.
+"""
+
+from __future__ import annotations
+
+import httpx
+
+_MAX_CONNECTIONS = 100
+_MAX_KEEPALIVE = 50
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide AsyncClient, building it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=_MAX_CONNECTIONS,
+                max_keepalive_connections=_MAX_KEEPALIVE,
+            ),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client's connection pool (called on app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
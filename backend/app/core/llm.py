@@ -0,0 +1,46 @@
+"""Shared Anthropic client.
+
+One AsyncAnthropic instance (and therefore one HTTP/2 connection pool) is
+reused by every agent in the process instead of each agent opening its own.
+"""
+
+from __future__ import annotations
+
+import anthropic
+
+from app.core.config import settings
+
+_MAX_CONNECTIONS = 64
+_MAX_KEEPALIVE = 16
+
+# The SDK's HTTP client only accepts config objects from the HTTP package it
+# is built on (httpx2 in current releases, httpx in older ones), so the
+# Limits class is taken from the SDK's own defaults rather than imported
+_Limits = type(anthropic.DEFAULT_CONNECTION_LIMITS)
+
+_client: anthropic.AsyncAnthropic | None = None
+
+
+def get_anthropic() -> anthropic.AsyncAnthropic:
+    """Return the process-wide AsyncAnthropic client, building it on first use."""
+    global _client
+    if _client is None:
+        _client = anthropic.AsyncAnthropic(
+            api_key=settings.anthropic_api_key or "dummy",
+            http_client=anthropic.DefaultAsyncHttpxClient(
+                http2=True,
+                limits=_Limits(
+                    max_connections=_MAX_CONNECTIONS,
+                    max_keepalive_connections=_MAX_KEEPALIVE,
+                ),
+            ),
+        )
+    return _client
+
+
+async def close_anthropic() -> None:
+    """Close the shared client's connection pool (called on app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
@@ -2,20 +2,109 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-from typing import Any
+from collections.abc import Callable
+from typing import Any, cast
 
+import msgpack
+import orjson
 from fastapi import WebSocket
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
+# Frames buffered per connection before the oldest are dropped
+_OUTBOX_SIZE = 256
+# Consecutive dropped frames after which a stalled client is closed
+_MAX_CONSECUTIVE_DROPS = 64
+# Persisted events are written in batches: every interval, or sooner once
+# this many are buffered
+_EVENT_FLUSH_SIZE = 100
+_EVENT_FLUSH_INTERVAL = 0.25
+# Flush interval after a failed write, so an unreachable DB isn't hammered
+_EVENT_RETRY_INTERVAL = 5.0
+# How long close() waits for the flusher to finish its last batch
+_FLUSHER_STOP_TIMEOUT = 5.0
+# Rows per INSERT statement, and the most rows held (newest kept) while
+# writes are failing
+_EVENT_INSERT_CHUNK = 1000
+_EVENT_BUFFER_MAX = 10_000
+
+
+def _dumps(message: Any) -> bytes:
+    """Serialize a WebSocket payload to UTF-8 JSON (datetimes/UUIDs fall back to str)."""
+    return orjson.dumps(message, default=str)
+
+
+def _packb(message: Any) -> bytes:
+    """Serialize a WebSocket payload to MessagePack (datetimes/UUIDs fall back to str)."""
+    return cast(bytes, msgpack.packb(message, default=str, use_bin_type=True))
+
+
+def _json_array(frames: list[bytes]) -> bytes:
+    return b"[" + b",".join(frames) + b"]"
+
+
+def _msgpack_array(frames: list[bytes]) -> bytes:
+    n = len(frames)
+    if n < 16:
+        header = bytes([0x90 | n])
+    elif n < 0x10000:
+        header = b"\xdc" + n.to_bytes(2, "big")
+    else:
+        header = b"\xdd" + n.to_bytes(4, "big")
+    return header + b"".join(frames)
+
+
+_Encoder = Callable[[Any], bytes]
+_Joiner = Callable[[list[bytes]], bytes]
+
+# wire format -> (encode one frame, join encoded frames into one array)
+_WIRE_FORMATS: dict[str, tuple[_Encoder, _Joiner]] = {
+    "json": (_dumps, _json_array),
+    "msgpack": (_packb, _msgpack_array),
+}
+
 
 class ConnectionManager:
-    """Manages WebSocket connections for real-time event broadcasting."""
+    """Manages WebSocket connections for real-time event broadcasting.
+
+    Each connection gets a bounded outbox drained by its own writer task,
+    so a slow client never stalls the publisher or other clients. When an
+    outbox is full the oldest queued frame is dropped; a client that keeps
+    overflowing is closed (code 1013) so it reconnects and resyncs.
+
+    Broadcast events are buffered and written to ``agent_events`` by a
+    background flusher, one transaction per batch.
 
-    def __init__(self) -> None:
+    Frames are pre-encoded (UTF-8 JSON, or MessagePack when
+    ``wire_format="msgpack"``) and sent as binary messages, so one encoded
+    payload is shared by every recipient. A lone frame is sent at once;
+    frames that queue up behind it, each within ``batch_delay`` seconds of
+    the last, are sent together as one array.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = settings.ws_batch_size,
+        batch_delay: float = settings.ws_batch_delay_ms / 1000,
+        wire_format: str = settings.ws_wire_format,
+    ) -> None:
+        self._encode, self._join = _WIRE_FORMATS[wire_format]
+        self._batch_size = batch_size
+        self._batch_delay = batch_delay
         self._connections: dict[str, WebSocket] = {}
+        self._outboxes: dict[str, asyncio.Queue[bytes]] = {}
+        self._writers: dict[str, asyncio.Task[None]] = {}
+        self._drops: dict[str, int] = {}
+        self._closing: set[asyncio.Task[None]] = set()
+        self._event_buffer: list[dict[str, Any]] = []
+        self._flush_now = asyncio.Event()
+        self._flusher: asyncio.Task[None] | None = None
+        self._stopping = False
 
     @property
     def active_count(self) -> int:
@@ -23,42 +112,120 @@ class ConnectionManager:
 
     async def connect(self, user_id: str, websocket: WebSocket) -> None:
         await websocket.accept()
+        self._stop_writer(user_id)
+        outbox: asyncio.Queue[bytes] = asyncio.Queue(maxsize=_OUTBOX_SIZE)
         self._connections[user_id] = websocket
+        self._outboxes[user_id] = outbox
+        self._writers[user_id] = asyncio.create_task(
+            self._writer(user_id, websocket, outbox)
+        )
         logger.info("WebSocket connected: %s (total: %d)", user_id, self.active_count)
 
     def disconnect(self, user_id: str) -> None:
         self._connections.pop(user_id, None)
+        self._stop_writer(user_id)
         logger.info("WebSocket disconnected: %s (total: %d)", user_id, self.active_count)
 
-    async def send_personal(self, user_id: str, message: dict[str, Any]) -> None:
-        ws = self._connections.get(user_id)
-        if ws:
+    async def close(self) -> None:
+        """Stop every writer task and flush buffered events (called on app shutdown)."""
+        for user_id in list(self._connections):
+            self.disconnect(user_id)
+        if self._flusher is not None:
+            # Ask the flusher to exit after its current batch rather than
+            # cancelling it mid-write; cancel only if it doesn't stop in time
+            self._stopping = True
+            self._flush_now.set()
+            done, _ = await asyncio.wait({self._flusher}, timeout=_FLUSHER_STOP_TIMEOUT)
+            if not done:
+                logger.warning("Agent event flusher did not stop, cancelling")
+                self._flusher.cancel()
+            self._flusher = None
+        await self._flush_events()
+
+    def _stop_writer(self, user_id: str) -> None:
+        self._outboxes.pop(user_id, None)
+        self._drops.pop(user_id, None)
+        task = self._writers.pop(user_id, None)
+        if task and task is not asyncio.current_task():
+            task.cancel()
+
+    async def _writer(
+        self, user_id: str, ws: WebSocket, outbox: asyncio.Queue[bytes]
+    ) -> None:
+        while True:
+            frames = [await outbox.get()]
+            # A lone frame goes out at once. While a burst is still arriving,
+            # wait up to batch_delay at a time for more, up to batch_size.
+            while len(frames) < self._batch_size and not outbox.empty():
+                while len(frames) < self._batch_size and not outbox.empty():
+                    frames.append(outbox.get_nowait())
+                if len(frames) < self._batch_size:
+                    await asyncio.sleep(self._batch_delay)
+            payload = frames[0] if len(frames) == 1 else self._join(frames)
             try:
-                await ws.send_text(json.dumps(message))
+                await ws.send_bytes(payload)
             except Exception:
-                self.disconnect(user_id)
+                # Only drop the registration if it still belongs to this socket
+                if self._connections.get(user_id) is ws:
+                    self.disconnect(user_id)
+                return
+
+    def _enqueue(self, user_id: str, payload: bytes) -> None:
+        outbox = self._outboxes.get(user_id)
+        if outbox is not None:
+            self._push(user_id, outbox, payload)
+
+    def _push(
+        self, user_id: str, outbox: asyncio.Queue[bytes], payload: bytes
+    ) -> None:
+        if not outbox.full():
+            self._drops[user_id] = 0
+            outbox.put_nowait(payload)
+            return
+        outbox.get_nowait()
+        outbox.put_nowait(payload)
+        drops = self._drops[user_id] = self._drops.get(user_id, 0) + 1
+        if drops >= _MAX_CONSECUTIVE_DROPS:
+            logger.warning("WebSocket %s too slow, closing", user_id)
+            self._evict(user_id)
+
+    def _evict(self, user_id: str) -> None:
+        ws = self._connections.get(user_id)
+        self.disconnect(user_id)
+        if ws is not None:
+            task = asyncio.create_task(self._close_quietly(ws))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close_quietly(ws: WebSocket) -> None:
+        try:
+            await ws.close(code=1013)
+        except Exception:
+            pass
+
+    async def send_personal(self, user_id: str, message: dict[str, Any]) -> None:
+        if user_id in self._connections:
+            self._enqueue(user_id, self._encode(message))
 
     async def broadcast(self, message: dict[str, Any]) -> None:
         """Broadcast to all connected clients AND persist to DB."""
-        text = json.dumps(message)
-        disconnected: list[str] = []
-        for user_id, ws in self._connections.items():
-            try:
-                await ws.send_text(text)
-            except Exception:
-                disconnected.append(user_id)
-        for uid in disconnected:
-            self.disconnect(uid)
+        payload = self._encode(message)
+        # Snapshot: evicting a stalled client mutates the outbox map
+        for user_id, outbox in tuple(self._outboxes.items()):
+            self._push(user_id, outbox, payload)
 
-        # Persist event to DB (fire-and-forget, don't block broadcast)
-        await self._persist_event(message)
+        # Queue the event for the DB flusher (never blocks the broadcast).
+        # Batched frames are stored as their individual events.
+        if message.get("type") == "batch":
+            for event in message.get("events", []):
+                self._persist_event(event)
+        else:
+            self._persist_event(message)
 
-    async def _persist_event(self, message: dict[str, Any]) -> None:
-        """Store the event in the agent_events table."""
+    def _persist_event(self, message: dict[str, Any]) -> None:
+        """Buffer the event for the agent_events table."""
         try:
-            from app.core.database import async_session_factory
-            from app.models.agent_event import AgentEventDB
-
             event_type = message.get("type", "unknown")
             data = message.get("data", {})
             source = data.get("agent", "nexus") if isinstance(data, dict) else "nexus"
@@ -66,18 +233,123 @@ class ConnectionManager:
             # Build a human-readable message
             msg, detail = _format_event(event_type, data)
 
+            self._event_buffer.append(
+                {
+                    "event_type": event_type,
+                    "source": source,
+                    "message": msg,
+                    "detail": detail,
+                    "data": data if isinstance(data, dict) else None,
+                }
+            )
+        except Exception:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Failed to build agent event", exc_info=True)
+            return
+
+        if len(self._event_buffer) > _EVENT_BUFFER_MAX:
+            del self._event_buffer[: len(self._event_buffer) - _EVENT_BUFFER_MAX]
+        if not self._stopping and (self._flusher is None or self._flusher.done()):
+            self._flusher = asyncio.create_task(self._event_flusher())
+        if len(self._event_buffer) >= _EVENT_FLUSH_SIZE:
+            self._flush_now.set()
+
+    async def _event_flusher(self) -> None:
+        interval = _EVENT_FLUSH_INTERVAL
+        while not self._stopping:
+            try:
+                async with asyncio.timeout(interval):
+                    await self._flush_now.wait()
+            except TimeoutError:
+                pass
+            self._flush_now.clear()
+            ok = await self._flush_events()
+            interval = _EVENT_FLUSH_INTERVAL if ok else _EVENT_RETRY_INTERVAL
+
+    async def _flush_events(self) -> bool:
+        """Write every buffered event in a single transaction.
+
+        Rows go out as multi-row INSERTs of up to ``_EVENT_INSERT_CHUNK``
+        rows, bypassing per-object ORM bookkeeping. On failure the batch is
+        put back for the next flush and False is returned.
+        """
+        if not self._event_buffer:
+            return True
+        batch, self._event_buffer = self._event_buffer, []
+        try:
+            from sqlalchemy import insert
+
+            from app.core.database import async_session_factory
+            from app.models.agent_event import AgentEventDB
+
             async with async_session_factory() as session:
-                event = AgentEventDB(
-                    event_type=event_type,
-                    source=source,
-                    message=msg,
-                    detail=detail,
-                    data=data if isinstance(data, dict) else None,
-                )
-                session.add(event)
+                for start in range(0, len(batch), _EVENT_INSERT_CHUNK):
+                    await session.execute(
+                        insert(AgentEventDB),
+                        batch[start : start + _EVENT_INSERT_CHUNK],
+                    )
                 await session.commit()
+            return True
         except Exception:
-            logger.debug("Failed to persist agent event", exc_info=True)
+            # Put the batch back ahead of newer events for the next flush
+            self._event_buffer[:0] = batch
+            dropped = len(self._event_buffer) - _EVENT_BUFFER_MAX
+            if dropped > 0:
+                del self._event_buffer[:dropped]
+            logger.warning(
+                "Failed to persist %d agent events (%d dropped, %d kept for retry)",
+                len(batch),
+                max(dropped, 0),
+                len(self._event_buffer),
+                exc_info=True,
+            )
+            return False
+
+
+# Built once at import; keyed by event type
+_FORMATTERS: dict[str, Callable[[dict[str, Any]], tuple[str, str]]] = {
+    "event:discovered": lambda d: (
+        f"Found event: {_nested(d, 'event', 'title', 'unknown')}",
+        f"Count: {d.get('count', '-')}",
+    ),
+    "event:analyzed": lambda d: (
+        f"Recommended: {_nested(d, 'event', 'title', 'event')} (Score: {d.get('score', '-')})",
+        d.get("why", ""),
+    ),
+    "event:applied": lambda d: (
+        (
+            f"Payment required: {_nested(d, 'event', 'title', 'event')}"
+            if d.get("payment_required")
+            else f"Applied to: {_nested(d, 'event', 'title', 'event')}"
+        ),
+        f"Amount: ${d['payment_amount']}" if d.get("payment_amount") else "",
+    ),
+    "event:scheduled": lambda d: (
+        f"Scheduled: {_nested(d, 'event', 'title', 'event')}",
+        "",
+    ),
+    "person:discovered": lambda d: (
+        f"Discovered person: {_nested(d, 'person', 'name', 'unknown')}",
+        "",
+    ),
+    "message:drafted": lambda d: (
+        "Drafted a message",
+        f"Channel: {d.get('channel', '-')}, Type: {d.get('type', '-')}",
+    ),
+    "message:sent": lambda _d: ("Sent a message", ""),
+    "agent:status": lambda d: (
+        f"Tool: {d['tool']}" if d.get("tool") else f"Agent {d.get('status', 'unknown')}",
+        d.get("detail", "") if d.get("detail") else (f"Status: {d.get('status')}" if d.get("tool") else ""),
+    ),
+    "target:found": lambda d: (
+        f"Target person matched: {_nested(d, 'target', 'name', '')}",
+        "",
+    ),
+    "target:updated": lambda d: (
+        f"Target updated: {_nested(d, 'target', 'name', '')}",
+        "",
+    ),
+}
 
 
 def _format_event(event_type: str, data: Any) -> tuple[str, str]:
@@ -85,54 +357,10 @@ def _format_event(event_type: str, data: Any) -> tuple[str, str]:
     if not isinstance(data, dict):
         return (event_type, "")
 
-    formatters: dict[str, Any] = {
-        "event:discovered": lambda d: (
-            f"Found event: {_nested(d, 'event', 'title', 'unknown')}",
-            f"Count: {d.get('count', '-')}",
-        ),
-        "event:analyzed": lambda d: (
-            f"Recommended: {_nested(d, 'event', 'title', 'event')} (Score: {d.get('score', '-')})",
-            d.get("why", ""),
-        ),
-        "event:applied": lambda d: (
-            (
-                f"Payment required: {_nested(d, 'event', 'title', 'event')}"
-                if d.get("payment_required")
-                else f"Applied to: {_nested(d, 'event', 'title', 'event')}"
-            ),
-            f"Amount: ${d['payment_amount']}" if d.get("payment_amount") else "",
-        ),
-        "event:scheduled": lambda d: (
-            f"Scheduled: {_nested(d, 'event', 'title', 'event')}",
-            "",
-        ),
-        "person:discovered": lambda d: (
-            f"Discovered person: {_nested(d, 'person', 'name', 'unknown')}",
-            "",
-        ),
-        "message:drafted": lambda d: (
-            "Drafted a message",
-            f"Channel: {d.get('channel', '-')}, Type: {d.get('type', '-')}",
-        ),
-        "message:sent": lambda _d: ("Sent a message", ""),
-        "agent:status": lambda d: (
-            f"Tool: {d['tool']}" if d.get("tool") else f"Agent {d.get('status', 'unknown')}",
-            d.get("detail", "") if d.get("detail") else (f"Status: {d.get('status')}" if d.get("tool") else ""),
-        ),
-        "target:found": lambda d: (
-            f"Target person matched: {_nested(d, 'target', 'name', '')}",
-            "",
-        ),
-        "target:updated": lambda d: (
-            f"Target updated: {_nested(d, 'target', 'name', '')}",
-            "",
-        ),
-    }
-
-    fn = formatters.get(event_type)
+    fn = _FORMATTERS.get(event_type)
     if fn:
         return fn(data)
-    return (event_type, json.dumps(data)[:200] if data else "")
+    return (event_type, _dumps(data).decode()[:200] if data else "")
 
 
 def _nested(d: dict[str, Any], key: str, sub: str, default: str) -> str:
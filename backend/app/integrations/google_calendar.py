@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
@@ -12,11 +14,47 @@ from googleapiclient.discovery import build
 class GoogleCalendarClient:
     credentials: Credentials
     calendar_id: str = "primary"
+    _cached_service: Any = field(init=False, default=None, repr=False)
+    # httplib2 (under the service object) is not thread-safe
+    _lock: threading.Lock = field(
+        init=False, default_factory=threading.Lock, repr=False
+    )
 
     def _service(self) -> Any:
-        return build("calendar", "v3", credentials=self.credentials)
+        # Built once per client from the bundled discovery document
+        if self._cached_service is None:
+            self._cached_service = build(
+                "calendar",
+                "v3",
+                credentials=self.credentials,
+                cache_discovery=False,
+                static_discovery=True,
+            )
+        return self._cached_service
+
+    async def check_busy(
+        self,
+        time_min: datetime,
+        time_max: datetime,
+    ) -> list[dict[str, str]]:
+        return await asyncio.to_thread(self._do_check_busy, time_min, time_max)
+
+    async def create_event(self, event_data: dict[str, Any]) -> dict[str, Any]:
+        return await asyncio.to_thread(self._do_create_event, event_data)
+
+    async def list_upcoming(
+        self,
+        time_min: datetime,
+        time_max: datetime,
+        max_results: int = 20,
+    ) -> list[dict[str, Any]]:
+        return await asyncio.to_thread(
+            self._do_list_upcoming, time_min, time_max, max_results
+        )
 
-    def check_busy(
+    # -- Blocking implementations (run in a worker thread) -------------------
+
+    def _do_check_busy(
         self,
         time_min: datetime,
         time_max: datetime,
@@ -27,37 +65,40 @@ class GoogleCalendarClient:
             "timeMax": time_max.isoformat() + "Z",
             "items": [{"id": self.calendar_id}],
         }
-        result = service.freebusy().query(body=body).execute()
+        with self._lock:
+            result = service.freebusy().query(body=body).execute()
         busy: list[dict[str, str]] = result.get("calendars", {}).get(self.calendar_id, {}).get("busy", [])
         return busy
 
-    def create_event(self, event_data: dict[str, Any]) -> dict[str, Any]:
+    def _do_create_event(self, event_data: dict[str, Any]) -> dict[str, Any]:
         service = self._service()
-        event: dict[str, Any] = (
-            service.events()
-            .insert(calendarId=self.calendar_id, body=event_data)
-            .execute()
-        )
+        with self._lock:
+            event: dict[str, Any] = (
+                service.events()
+                .insert(calendarId=self.calendar_id, body=event_data)
+                .execute()
+            )
         return event
 
-    def list_upcoming(
+    def _do_list_upcoming(
         self,
         time_min: datetime,
         time_max: datetime,
         max_results: int = 20,
     ) -> list[dict[str, Any]]:
         service = self._service()
-        result = (
-            service.events()
-            .list(
-                calendarId=self.calendar_id,
-                timeMin=time_min.isoformat() + "Z",
-                timeMax=time_max.isoformat() + "Z",
-                maxResults=max_results,
-                singleEvents=True,
-                orderBy="startTime",
+        with self._lock:
+            result = (
+                service.events()
+                .list(
+                    calendarId=self.calendar_id,
+                    timeMin=time_min.isoformat() + "Z",
+                    timeMax=time_max.isoformat() + "Z",
+                    maxResults=max_results,
+                    singleEvents=True,
+                    orderBy="startTime",
+                )
+                .execute()
             )
-            .execute()
-        )
         items: list[dict[str, Any]] = result.get("items", [])
         return items
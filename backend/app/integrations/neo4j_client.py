@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
 
-from neo4j import AsyncDriver, AsyncGraphDatabase
+from neo4j import AsyncDriver, AsyncGraphDatabase, RoutingControl
 
 
 @dataclass
@@ -11,15 +11,25 @@ class Neo4jClient:
     uri: str
     user: str
     password: str
+    max_pool_size: int | None = None
+    acquisition_timeout: float | None = None
     _driver: AsyncDriver | None = field(init=False, default=None, repr=False)
 
     async def connect(self) -> None:
         if self._driver is not None:
             return
+        pool_kwargs: dict[str, Any] = {}
+        if self.max_pool_size is not None:
+            pool_kwargs["max_connection_pool_size"] = self.max_pool_size
+        if self.acquisition_timeout is not None:
+            pool_kwargs["connection_acquisition_timeout"] = self.acquisition_timeout
         self._driver = AsyncGraphDatabase.driver(
-            self.uri, auth=(self.user, self.password)
+            self.uri, auth=(self.user, self.password), **pool_kwargs
         )
 
+    async def verify_connectivity(self) -> None:
+        await self._ensure_connected().verify_connectivity()
+
     async def disconnect(self) -> None:
         if self._driver is not None:
             await self._driver.close()
@@ -36,20 +46,19 @@ class Neo4jClient:
         self, cypher: str, parameters: dict[str, Any] | None = None
     ) -> list[dict[str, Any]]:
         driver = self._ensure_connected()
-        async with driver.session() as session:
-            result = await session.run(cypher, parameters or {})  # type: ignore[arg-type]
-            records = await result.data()
-            return records
+        records, _, _ = await driver.execute_query(
+            cypher, parameters_=parameters or {}
+        )
+        return [record.data() for record in records]
 
     async def execute_write(
         self, cypher: str, parameters: dict[str, Any] | None = None
     ) -> list[dict[str, Any]]:
         driver = self._ensure_connected()
-        async with driver.session() as session:
-            result = await session.run(cypher, parameters or {})  # type: ignore[arg-type]
-            records = await result.data()
-            await result.consume()
-            return records
+        records, _, _ = await driver.execute_query(
+            cypher, parameters_=parameters or {}, routing_=RoutingControl.WRITE
+        )
+        return [record.data() for record in records]
 
     # -- Domain-specific merge helpers -----------------------------------------
 
@@ -93,6 +102,64 @@ class Neo4jClient:
             cypher, {"name": data["name"], "props": data}
         )
 
+    # -- Bulk variants (one round trip per batch via UNWIND) --------------------
+
+    async def _merge_nodes(
+        self, label: str, key: str, rows: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        if not rows:
+            return []
+        cypher = (
+            "UNWIND $rows AS row "
+            f"MERGE (n:{label} {{{key}: row.{key}}}) "
+            "SET n += row "
+            "RETURN n"
+        )
+        return await self.execute_write(cypher, {"rows": rows})
+
+    async def merge_events(
+        self, rows: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        return await self._merge_nodes("Event", "url", rows)
+
+    async def merge_persons(
+        self, rows: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        return await self._merge_nodes("Person", "name", rows)
+
+    async def merge_companies(
+        self, rows: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        return await self._merge_nodes("Company", "name", rows)
+
+    async def merge_topics(
+        self, rows: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        return await self._merge_nodes("Topic", "name", rows)
+
+    async def create_relationships(
+        self,
+        from_label: str,
+        from_key: str,
+        rel_type: str,
+        to_label: str,
+        to_key: str,
+        pairs: list[tuple[str, str]],
+    ) -> list[dict[str, Any]]:
+        """MERGE ``rel_type`` edges for each (from_value, to_value) pair."""
+        if not pairs:
+            return []
+        cypher = (
+            "UNWIND $pairs AS pair "
+            f"MATCH (a:{from_label} {{{from_key}: pair[0]}}) "
+            f"MATCH (b:{to_label} {{{to_key}: pair[1]}}) "
+            f"MERGE (a)-[r:{rel_type}]->(b) "
+            "RETURN type(r) as rel_type"
+        )
+        return await self.execute_write(
+            cypher, {"pairs": [list(pair) for pair in pairs]}
+        )
+
     async def create_relationship(
         self,
         from_label: str,
@@ -5,6 +5,8 @@ from typing import Any
 
 import httpx
 
+from app.core.http import get_http_client
+
 _DEFAULT_BASE_URL = "https://api.reka.ai"
 _TIMEOUT = 60.0
 
@@ -28,23 +30,30 @@ class RekaVisionResult:
 class RekaClient:
     api_key: str
     base_url: str = _DEFAULT_BASE_URL
-    _client: httpx.AsyncClient = field(init=False, repr=False)
+    http: httpx.AsyncClient = field(default_factory=get_http_client, repr=False)
 
     def __post_init__(self) -> None:
         if not self.api_key:
             raise ValueError("reka_api_key is required")
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers={"X-API-Key": self.api_key},
-            timeout=_TIMEOUT,
-        )
+        self._headers = {"X-API-Key": self.api_key}
 
     async def close(self) -> None:
-        await self._client.aclose()
+        """No-op: the pool is shared and closed by close_http_client() on shutdown."""
+
+    async def _request(
+        self, method: str, path: str, **kwargs: Any
+    ) -> httpx.Response:
+        return await self.http.request(
+            method,
+            self.base_url + path,
+            headers=self._headers,
+            timeout=_TIMEOUT,
+            **kwargs,
+        )
 
     async def analyze(self, url: str, prompt: str) -> RekaVisionResult:
         body = {"url": url, "prompt": prompt}
-        resp = await self._client.post("/v1/vision/analyze", json=body)
+        resp = await self._request("POST", "/v1/vision/analyze", json=body)
         resp.raise_for_status()
         return RekaVisionResult.from_response(resp.json())
 
@@ -52,6 +61,6 @@ class RekaClient:
         self, urls: list[str], prompt: str
     ) -> RekaVisionResult:
         body = {"urls": urls, "prompt": prompt}
-        resp = await self._client.post("/v1/vision/compare", json=body)
+        resp = await self._request("POST", "/v1/vision/compare", json=body)
         resp.raise_for_status()
         return RekaVisionResult.from_response(resp.json())
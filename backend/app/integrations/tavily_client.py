@@ -15,15 +15,12 @@ class TavilySearchResult:
 
     @classmethod
     def from_response(cls, data: dict[str, Any]) -> TavilySearchResult:
+        results = data.get("results", [])
         return cls(
             query=data.get("query", ""),
             answer=data.get("answer"),
-            results=data.get("results", []),
-            raw_content=[
-                r.get("raw_content", "")
-                for r in data.get("results", [])
-                if r.get("raw_content")
-            ],
+            results=results,
+            raw_content=[raw for r in results if (raw := r.get("raw_content"))],
         )
 
 
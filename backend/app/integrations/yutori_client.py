@@ -5,6 +5,8 @@ from typing import Any
 
 import httpx
 
+from app.core.http import get_http_client
+
 _DEFAULT_BASE_URL = "https://api.yutori.com"
 _TIMEOUT = 30.0
 
@@ -28,19 +30,26 @@ class YutoriTask:
 class YutoriClient:
     api_key: str
     base_url: str = _DEFAULT_BASE_URL
-    _client: httpx.AsyncClient = field(init=False, repr=False)
+    http: httpx.AsyncClient = field(default_factory=get_http_client, repr=False)
 
     def __post_init__(self) -> None:
         if not self.api_key:
             raise ValueError("yutori_api_key is required")
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers={"X-API-Key": self.api_key},
-            timeout=_TIMEOUT,
-        )
+        self._headers = {"X-API-Key": self.api_key}
 
     async def close(self) -> None:
-        await self._client.aclose()
+        """No-op: the pool is shared and closed by close_http_client() on shutdown."""
+
+    async def _request(
+        self, method: str, path: str, **kwargs: Any
+    ) -> httpx.Response:
+        return await self.http.request(
+            method,
+            self.base_url + path,
+            headers=self._headers,
+            timeout=_TIMEOUT,
+            **kwargs,
+        )
 
     # -- Browsing API ----------------------------------------------------------
 
@@ -61,12 +70,12 @@ class YutoriClient:
         if webhook_url:
             body["webhook_url"] = webhook_url
 
-        resp = await self._client.post("/v1/browsing/tasks", json=body)
+        resp = await self._request("POST", "/v1/browsing/tasks", json=body)
         resp.raise_for_status()
         return YutoriTask.from_response(resp.json())
 
     async def browsing_get(self, task_id: str) -> YutoriTask:
-        resp = await self._client.get(f"/v1/browsing/tasks/{task_id}")
+        resp = await self._request("GET", f"/v1/browsing/tasks/{task_id}")
         resp.raise_for_status()
         return YutoriTask.from_response(resp.json())
 
@@ -88,6 +97,6 @@ class YutoriClient:
         if webhook_url:
             body["webhook_url"] = webhook_url
 
-        resp = await self._client.post("/v1/scouting/tasks", json=body)
+        resp = await self._request("POST", "/v1/scouting/tasks", json=body)
         resp.raise_for_status()
         return YutoriTask.from_response(resp.json())
@@ -1,3 +1,5 @@
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 from collections.abc import AsyncGenerator
 
@@ -5,9 +7,18 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.agent_manager import agent_manager
-from app.core.config import settings
-from app.core.database import Base, engine
+from app.core.config import get_settings
+from app.core.database import (
+    Base,
+    check_server_generated_ids,
+    create_missing_indexes,
+    engine,
+)
+from app.core.http import close_http_client
+from app.core.llm import close_anthropic
 from app.core.websocket import manager
+from app.models import load_all as load_all_models
+from app.models.agent_event import create_agent_event_partitions
 from app.routers import (
     agent_control,
     auth,
@@ -22,13 +33,33 @@ from app.routers import (
     webhooks,
 )
 
+logger = logging.getLogger(__name__)
+
+# How often upcoming agent_events partitions are (re)created
+_PARTITION_CHECK_INTERVAL_S = 24 * 60 * 60
+
+
+async def _maintain_partitions() -> None:
+    while True:
+        await asyncio.sleep(_PARTITION_CHECK_INTERVAL_S)
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(create_agent_event_partitions)
+        except Exception:
+            logger.exception("Failed to create agent_events partitions")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup: create tables if not exist (keeps data across restarts)
+    load_all_models()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    print(f"[NEXUS] Starting in {settings.nexus_mode.value} mode")
+        await conn.run_sync(check_server_generated_ids)
+        await conn.run_sync(create_agent_event_partitions)
+        await conn.run_sync(create_missing_indexes)
+    partition_task = asyncio.create_task(_maintain_partitions())
+    print(f"[NEXUS] Starting in {get_settings().nexus_mode.value} mode")
 
     # Start the background agent (runs for first onboarded user)
     await agent_manager.start()
@@ -36,7 +67,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
 
     # Shutdown: stop agent gracefully
+    partition_task.cancel()
+    try:
+        await partition_task
+    except asyncio.CancelledError:
+        pass
     await agent_manager.stop()
+    await agent_manager.close()
+    await close_anthropic()
+    await close_http_client()
+    await manager.close()
     print("[NEXUS] Shutting down")
 
 
@@ -49,7 +89,7 @@ app = FastAPI(
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[settings.frontend_url],
+    allow_origins=[get_settings().frontend_url],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -72,7 +112,7 @@ app.include_router(webhooks.router)
 
 @app.get("/health")
 async def health_check() -> dict[str, str]:
-    return {"status": "ok", "mode": settings.nexus_mode.value}
+    return {"status": "ok", "mode": get_settings().nexus_mode.value}
 
 
 @app.websocket("/ws/{user_id}")
@@ -1,49 +1,55 @@
-from app.models.agent_event import AgentEventDB
-from app.models.agent_state import AgentStateDB
-from app.models.chat import ChatMessageDB
-from app.models.event import (
-    ApplicationResult,
-    EnrichedEvent,
-    EventCreate,
-    EventDB,
-    EventResponse,
-    EventSource,
-    EventStatus,
-    EventType,
-    RawEvent,
-)
-from app.models.feedback import (
-    Feedback,
-    FeedbackAction,
-    FeedbackDB,
-    FeedbackResponse,
-    RejectionReason,
-)
-from app.models.message import (
-    ColdMessage,
-    MessageChannel,
-    MessageCreate,
-    MessageDB,
-    MessageResponse,
-    MessageStatus,
-)
-from app.models.person import (
-    PersonDB,
-    PersonProfile,
-    PersonResponse,
-    RawAttendee,
-    SocialLinks,
-)
-from app.models.profile import (
-    MessageTone,
-    ScoringWeights,
-    TargetPerson,
-    TargetPersonDB,
-    TargetPriority,
-    TargetStatus,
-    UserProfile,
-    UserProfileDB,
-)
+"""Model re-exports, resolved lazily on first attribute access (PEP 562).
+
+Importing one model module does not pull in every other model (and build
+its pydantic validators). Call :func:`load_all` before using
+``Base.metadata`` so that every table is registered.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# exported name -> defining module
+_LAZY: dict[str, str] = {
+    "AgentEventDB": "app.models.agent_event",
+    "AgentStateDB": "app.models.agent_state",
+    "ChatMessageDB": "app.models.chat",
+    "ApplicationResult": "app.models.event",
+    "EnrichedEvent": "app.models.event",
+    "EventCreate": "app.models.event",
+    "EventDB": "app.models.event",
+    "EventResponse": "app.models.event",
+    "EventSource": "app.models.event",
+    "EventStatus": "app.models.event",
+    "EventType": "app.models.event",
+    "RawEvent": "app.models.event",
+    "Speaker": "app.models.event",
+    "Feedback": "app.models.feedback",
+    "FeedbackAction": "app.models.feedback",
+    "FeedbackDB": "app.models.feedback",
+    "FeedbackResponse": "app.models.feedback",
+    "RejectionReason": "app.models.feedback",
+    "ColdMessage": "app.models.message",
+    "MessageChannel": "app.models.message",
+    "MessageCreate": "app.models.message",
+    "MessageDB": "app.models.message",
+    "MessageResponse": "app.models.message",
+    "MessageStatus": "app.models.message",
+    "MutualConnection": "app.models.person",
+    "PersonDB": "app.models.person",
+    "PersonProfile": "app.models.person",
+    "PersonResponse": "app.models.person",
+    "RawAttendee": "app.models.person",
+    "SocialLinks": "app.models.person",
+    "MessageTone": "app.models.profile",
+    "ScoringWeights": "app.models.profile",
+    "TargetPerson": "app.models.profile",
+    "TargetPriority": "app.models.profile",
+    "TargetStatus": "app.models.profile",
+    "UserProfile": "app.models.profile",
+    "UserProfileDB": "app.models.profile",
+}
 
 __all__ = [
     # Agent Event
@@ -62,6 +68,7 @@ __all__ = [
     "EventStatus",
     "EventType",
     "RawEvent",
+    "Speaker",
     # Feedback
     "Feedback",
     "FeedbackAction",
@@ -76,6 +83,7 @@ __all__ = [
     "MessageResponse",
     "MessageStatus",
     # Person
+    "MutualConnection",
     "PersonDB",
     "PersonProfile",
     "PersonResponse",
@@ -85,9 +93,23 @@ __all__ = [
     "MessageTone",
     "ScoringWeights",
     "TargetPerson",
-    "TargetPersonDB",
     "TargetPriority",
     "TargetStatus",
     "UserProfile",
     "UserProfileDB",
 ]
+
+
+def load_all() -> None:
+    """Import every model module so all tables are on ``Base.metadata``."""
+    for module in dict.fromkeys(_LAZY.values()):
+        importlib.import_module(module)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
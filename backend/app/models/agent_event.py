@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
-import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, String, Text
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy import (
+    BigInteger,
+    Connection,
+    DateTime,
+    Identity,
+    Index,
+    String,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
@@ -14,17 +23,76 @@ from app.core.database import Base
 
 class AgentEventDB(Base):
     __tablename__ = "agent_events"
+    # Activity feed: filter by source / event type, newest first.
+    # Range-partitioned by month on created_at (see create_agent_event_partitions),
+    # so the newest-first scans only touch the latest partitions.
+    __table_args__ = (
+        Index("ix_agent_events_source_created", "source", "created_at"),
+        Index("ix_agent_events_type_created", "event_type", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
+    # Narrow, monotonic key: appends land on the right edge of the PK index.
+    # The partition key must be part of the primary key, and the UUID id
+    # (the public identifier) can only be indexed, not unique, per table.
+    pk_id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=True), primary_key=True
+    )
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        UUID(as_uuid=False),
+        index=True,
+        nullable=False,
+        server_default=text("gen_random_uuid()"),
     )
-    event_type: Mapped[str] = mapped_column(String(64), index=True)
+    event_type: Mapped[str] = mapped_column(String(64))
     source: Mapped[str] = mapped_column(String(32), default="nexus")  # "nexus" or "chat"
     message: Mapped[str] = mapped_column(Text, default="")
     detail: Mapped[str] = mapped_column(Text, default="")
     data: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    # clock_timestamp(), not now(): events are inserted in batches, and
+    # now() would stamp a whole transaction with one time, losing their order
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        primary_key=True,
+        server_default=func.clock_timestamp(),
         index=True,
     )
+
+
+def create_agent_event_partitions(conn: Connection, months_ahead: int = 2) -> None:
+    """Create the monthly agent_events partitions up to ``months_ahead`` out.
+
+    Also creates a DEFAULT partition so an insert outside every monthly
+    range never fails. Old months are pruned with ``DROP TABLE`` on their
+    partition. Idempotent. Raises when ``agent_events`` predates
+    partitioning (``create_all`` leaves existing tables alone): inserts need
+    its identity key and server defaults, so the API must not start on it.
+    """
+    partitioned = conn.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = to_regclass('agent_events')"
+        )
+    ).first()
+    if partitioned is None:
+        raise RuntimeError("agent_events is not partitioned; run scripts/migrate.py")
+
+    now = datetime.now(timezone.utc)
+    year, month = now.year, now.month
+    for _ in range(months_ahead + 1):
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        conn.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS agent_events_y{year}m{month:02d} "
+                "PARTITION OF agent_events FOR VALUES "
+                f"FROM ('{year}-{month:02d}-01 00:00+00') "
+                f"TO ('{next_year}-{next_month:02d}-01 00:00+00')"
+            )
+        )
+        year, month = next_year, next_month
+    conn.execute(
+        text(
+            "CREATE TABLE IF NOT EXISTS agent_events_default "
+            "PARTITION OF agent_events DEFAULT"
+        )
+    )
@@ -5,11 +5,11 @@ from datetime import datetime
 from typing import Any
 
 from pydantic import BaseModel, Field
-from sqlalchemy import DateTime, Enum, Float, Integer, String, Text, func
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy import DateTime, Float, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.core.database import Base
+from app.core.database import Base, utc_now, varchar_enum
 
 
 # ── Enums ──────────────────────────────────────────────────────────────────────
@@ -52,12 +52,20 @@ class EventStatus(str, enum.Enum):
 class RawEvent(BaseModel):
     """Event as scraped from source, before NER enrichment."""
 
-    title: str
-    url: str
+    title: str = Field(max_length=255)
+    url: str = Field(max_length=2048)
     source: EventSource
     description: str
 
 
+class Speaker(BaseModel):
+    """Speaker as extracted by NER (see AnalyzeAgent.extract_entities)."""
+
+    name: str
+    role: str | None = None
+    company: str | None = None
+
+
 class ApplicationResult(BaseModel):
     status: str  # applied | waitlisted | failed | payment_required
     confirmation_id: str | None = None
@@ -68,18 +76,18 @@ class EnrichedEvent(BaseModel):
     """Event after Claude NER and scoring."""
 
     id: str
-    url: str
-    title: str
+    url: str = Field(max_length=2048)
+    title: str = Field(max_length=255)
     description: str
     source: EventSource
 
     event_type: EventType
     date: datetime
     end_date: datetime | None = None
-    location: str
+    location: str = Field(max_length=255)
     capacity: int | None = None
     price: float | None = None
-    speakers: list[dict[str, Any]] = Field(default_factory=list)
+    speakers: list[Speaker] = Field(default_factory=list)
     topics: list[str] = Field(default_factory=list)
     target_audience: str = ""
     application_required: bool = False
@@ -92,24 +100,26 @@ class EnrichedEvent(BaseModel):
     calendar_event_id: str | None = None
     user_rating: int | None = Field(default=None, ge=1, le=5)
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
+
+    model_config = {"frozen": True}
 
 
 class EventCreate(BaseModel):
     """Payload for creating an event via API."""
 
-    url: str
-    title: str
+    url: str = Field(max_length=2048)
+    title: str = Field(max_length=255)
     description: str
     source: EventSource
     event_type: EventType
     date: datetime
     end_date: datetime | None = None
-    location: str
+    location: str = Field(max_length=255)
     capacity: int | None = None
     price: float | None = None
-    speakers: list[dict[str, Any]] = Field(default_factory=list)
+    speakers: list[Speaker] = Field(default_factory=list)
     topics: list[str] = Field(default_factory=list)
     target_audience: str = ""
     application_required: bool = False
@@ -130,7 +140,7 @@ class EventResponse(BaseModel):
     location: str
     capacity: int | None = None
     price: float | None = None
-    speakers: list[dict[str, Any]] = Field(default_factory=list)
+    speakers: list[Speaker] = Field(default_factory=list)
     topics: list[str] = Field(default_factory=list)
     target_audience: str = ""
     application_required: bool = False
@@ -151,20 +161,24 @@ class EventResponse(BaseModel):
 
 class EventDB(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        Index("ix_events_status_date", "status", "date"),
+        Index("ix_events_status_score", "status", "relevance_score"),
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    url: Mapped[str] = mapped_column(Text, nullable=False)
-    title: Mapped[str] = mapped_column(Text, nullable=False)
+    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
+    url: Mapped[str] = mapped_column(String(2048), nullable=False)
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
-    source: Mapped[str] = mapped_column(Enum(EventSource), nullable=False)
+    source: Mapped[str] = mapped_column(varchar_enum(EventSource), nullable=False)
 
-    event_type: Mapped[str] = mapped_column(Enum(EventType), nullable=False)
+    event_type: Mapped[str] = mapped_column(varchar_enum(EventType), nullable=False)
     date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     end_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    location: Mapped[str] = mapped_column(Text, nullable=False)
+    location: Mapped[str] = mapped_column(String(255), nullable=False)
     capacity: Mapped[int | None] = mapped_column(Integer, nullable=True)
     price: Mapped[float | None] = mapped_column(Float, nullable=True)
-    speakers: Mapped[list[Any]] = mapped_column(JSONB, default=list)
+    speakers: Mapped[list[dict[str, Any]]] = mapped_column(JSONB, default=list)
     topics: Mapped[list[str]] = mapped_column(ARRAY(String), default=list)
     target_audience: Mapped[str] = mapped_column(Text, default="")
     application_required: Mapped[bool] = mapped_column(default=False)
@@ -172,7 +186,7 @@ class EventDB(Base):
     relevance_score: Mapped[float] = mapped_column(Float, nullable=False, default=0)
 
     status: Mapped[str] = mapped_column(
-        Enum(EventStatus), nullable=False, default=EventStatus.DISCOVERED.value
+        varchar_enum(EventStatus), nullable=False, default=EventStatus.DISCOVERED.value
     )
     rejection_reason: Mapped[str | None] = mapped_column(Text, nullable=True)
     application_result: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
@@ -4,10 +4,11 @@ import enum
 from datetime import datetime
 
 from pydantic import BaseModel, Field
-from sqlalchemy import DateTime, Enum, Integer, String, Text, func
+from sqlalchemy import DateTime, Index, Integer, Text, func
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.core.database import Base
+from app.core.database import Base, utc_now, varchar_enum
 
 
 # ── Enums ──────────────────────────────────────────────────────────────────────
@@ -47,7 +48,7 @@ class Feedback(BaseModel):
     free_text: str | None = None
     rating: int | None = Field(default=None, ge=1, le=5)
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
 
 
 class FeedbackResponse(BaseModel):
@@ -72,14 +73,15 @@ class FeedbackResponse(BaseModel):
 
 class FeedbackDB(Base):
     __tablename__ = "feedback"
+    __table_args__ = (Index("ix_feedback_user_created", "user_id", "created_at"),)
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    user_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
-    event_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
-    person_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
-    message_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
+    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
+    user_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
+    event_id: Mapped[str | None] = mapped_column(UUID(as_uuid=False), nullable=True)
+    person_id: Mapped[str | None] = mapped_column(UUID(as_uuid=False), nullable=True)
+    message_id: Mapped[str | None] = mapped_column(UUID(as_uuid=False), nullable=True)
 
-    action: Mapped[str] = mapped_column(Enum(FeedbackAction), nullable=False)
+    action: Mapped[str] = mapped_column(varchar_enum(FeedbackAction), nullable=False)
     reason: Mapped[str | None] = mapped_column(Text, nullable=True)
     free_text: Mapped[str | None] = mapped_column(Text, nullable=True)
     rating: Mapped[int | None] = mapped_column(Integer, nullable=True)
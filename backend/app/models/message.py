@@ -4,10 +4,11 @@ import enum
 from datetime import datetime
 
 from pydantic import BaseModel, Field
-from sqlalchemy import DateTime, Enum, String, Text, func
+from sqlalchemy import DateTime, Index, Text, func
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.core.database import Base
+from app.core.database import Base, utc_now, varchar_enum
 
 
 # ── Enums ──────────────────────────────────────────────────────────────────────
@@ -44,8 +45,10 @@ class ColdMessage(BaseModel):
     sent_at: datetime | None = None
     response_received: bool = False
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
+
+    model_config = {"frozen": True}
 
 
 class MessageCreate(BaseModel):
@@ -80,15 +83,19 @@ class MessageResponse(BaseModel):
 
 class MessageDB(Base):
     __tablename__ = "messages"
+    __table_args__ = (
+        Index("ix_messages_event_status", "event_id", "status"),
+        Index("ix_messages_recipient_status", "recipient_id", "status"),
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    recipient_id: Mapped[str] = mapped_column(String(36), nullable=False)
-    event_id: Mapped[str] = mapped_column(String(36), nullable=False)
-    channel: Mapped[str] = mapped_column(Enum(MessageChannel), nullable=False)
+    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
+    recipient_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
+    event_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
+    channel: Mapped[str] = mapped_column(varchar_enum(MessageChannel), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
 
     status: Mapped[str] = mapped_column(
-        Enum(MessageStatus), nullable=False, default=MessageStatus.DRAFT.value
+        varchar_enum(MessageStatus), nullable=False, default=MessageStatus.DRAFT.value
     )
     user_edits: Mapped[str | None] = mapped_column(Text, nullable=True)
     sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
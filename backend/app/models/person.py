@@ -4,10 +4,10 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field
 from sqlalchemy import DateTime, Float, String, Text, func
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.core.database import Base
+from app.core.database import Base, utc_now
 
 
 # ── Pydantic Schemas ──────────────────────────────────────────────────────────
@@ -21,30 +21,38 @@ class SocialLinks(BaseModel):
 class RawAttendee(BaseModel):
     """Minimal attendee info scraped from event pages."""
 
+    name: str = Field(max_length=255)
+    title: str | None = Field(default=None, max_length=255)
+    company: str | None = Field(default=None, max_length=255)
+    linkedin: str | None = Field(default=None, max_length=2048)
+    twitter: str | None = Field(default=None, max_length=2048)
+
+
+class MutualConnection(BaseModel):
     name: str
     title: str | None = None
     company: str | None = None
-    linkedin: str | None = None
-    twitter: str | None = None
 
 
 class PersonProfile(BaseModel):
     """Fully enriched person profile."""
 
     id: str
-    name: str
-    title: str | None = None
-    company: str | None = None
-    linkedin: str | None = None
-    twitter: str | None = None
+    name: str = Field(max_length=255)
+    title: str | None = Field(default=None, max_length=255)
+    company: str | None = Field(default=None, max_length=255)
+    linkedin: str | None = Field(default=None, max_length=2048)
+    twitter: str | None = Field(default=None, max_length=2048)
 
     connection_score: float = Field(ge=0, le=100)
-    mutual_connections: list[dict[str, str]] = Field(default_factory=list)
+    mutual_connections: list[MutualConnection] = Field(default_factory=list)
     shared_topics: list[str] = Field(default_factory=list)
     research_summary: str | None = None
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
+
+    model_config = {"frozen": True}
 
 
 class PersonResponse(BaseModel):
@@ -57,7 +65,7 @@ class PersonResponse(BaseModel):
     linkedin: str | None = None
     twitter: str | None = None
     connection_score: float
-    mutual_connections: list[dict[str, str]] = Field(default_factory=list)
+    mutual_connections: list[MutualConnection] = Field(default_factory=list)
     shared_topics: list[str] = Field(default_factory=list)
     research_summary: str | None = None
     created_at: datetime
@@ -72,12 +80,12 @@ class PersonResponse(BaseModel):
 class PersonDB(Base):
     __tablename__ = "persons"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    name: Mapped[str] = mapped_column(Text, nullable=False)
-    title: Mapped[str | None] = mapped_column(Text, nullable=True)
-    company: Mapped[str | None] = mapped_column(Text, nullable=True)
-    linkedin: Mapped[str | None] = mapped_column(Text, nullable=True)
-    twitter: Mapped[str | None] = mapped_column(Text, nullable=True)
+    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    title: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    company: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    linkedin: Mapped[str | None] = mapped_column(String(2048), nullable=True)
+    twitter: Mapped[str | None] = mapped_column(String(2048), nullable=True)
 
     connection_score: Mapped[float] = mapped_column(Float, nullable=False, default=0)
     mutual_connections: Mapped[list[dict[str, str]]] = mapped_column(JSONB, default=list)
@@ -4,11 +4,21 @@ import enum
 from datetime import datetime
 
 from pydantic import BaseModel, Field
-from sqlalchemy import Boolean, DateTime, Enum, Float, Integer, String, Text, func
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.core.database import Base
+from app.core.database import Base, utc_now, varchar_enum
 
 
 # ── Enums ──────────────────────────────────────────────────────────────────────
@@ -48,13 +58,13 @@ class TargetPerson(BaseModel):
     """A specific individual the user wants to connect with."""
 
     id: str
-    name: str
-    company: str | None = None
-    role: str | None = None
+    name: str = Field(max_length=255)
+    company: str | None = Field(default=None, max_length=255)
+    role: str | None = Field(default=None, max_length=255)
     reason: str
     priority: TargetPriority = TargetPriority.MEDIUM
     status: TargetStatus = TargetStatus.SEARCHING
-    added_at: datetime = Field(default_factory=datetime.utcnow)
+    added_at: datetime = Field(default_factory=utc_now)
     matched_events: list[str] = Field(default_factory=list)  # event IDs
 
 
@@ -95,8 +105,8 @@ class UserProfile(BaseModel):
     suggest_threshold: int = Field(default=50, ge=0, le=100)
     auto_schedule_threshold: int = Field(default=85, ge=0, le=100)
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
 
 
 # ── SQLAlchemy ─────────────────────────────────────────────────────────────────
@@ -104,8 +114,16 @@ class UserProfile(BaseModel):
 
 class UserProfileDB(Base):
     __tablename__ = "user_profiles"
+    # Email/password login matches case-insensitively
+    __table_args__ = (
+        Index("ix_user_profiles_email_lower", func.lower(text("email"))),
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
     name: Mapped[str] = mapped_column(Text, nullable=False)
     email: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
 
@@ -137,7 +155,7 @@ class UserProfileDB(Base):
     preferred_days: Mapped[list[str]] = mapped_column(ARRAY(String), default=list)
     preferred_times: Mapped[list[str]] = mapped_column(ARRAY(String), default=list)
     message_tone: Mapped[str] = mapped_column(
-        Enum(MessageTone), default=MessageTone.CASUAL.value
+        varchar_enum(MessageTone), default=MessageTone.CASUAL.value
     )
 
     auto_apply_threshold: Mapped[int] = mapped_column(Integer, default=80)
@@ -150,25 +168,3 @@ class UserProfileDB(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
-
-
-class TargetPersonDB(Base):
-    __tablename__ = "target_persons"
-
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    user_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
-    name: Mapped[str] = mapped_column(Text, nullable=False)
-    company: Mapped[str | None] = mapped_column(Text, nullable=True)
-    role: Mapped[str | None] = mapped_column(Text, nullable=True)
-    reason: Mapped[str] = mapped_column(Text, nullable=False)
-    priority: Mapped[str] = mapped_column(
-        Enum(TargetPriority), default=TargetPriority.MEDIUM.value
-    )
-    status: Mapped[str] = mapped_column(
-        Enum(TargetStatus), default=TargetStatus.SEARCHING.value
-    )
-    matched_events: Mapped[list[str]] = mapped_column(ARRAY(String), default=list)
-
-    added_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
-    )
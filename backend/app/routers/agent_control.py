@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select
+import orjson
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy import bindparam, select
 
 from app.core.agent_manager import agent_manager
 from app.core.deps import DbSession, get_current_user
@@ -15,6 +16,26 @@ router = APIRouter(
     dependencies=[Depends(get_current_user)],
 )
 
+# Plain column rows: the DB is the only writer of agent_events, so the
+# response is built straight from them without ORM hydration or pydantic
+# validation. Columns are labelled with their response keys, and orjson
+# formats created_at in C. Both variants are built once; requests only bind
+# parameters.
+_EVENTS_STMT = (
+    select(
+        AgentEventDB.id,
+        AgentEventDB.event_type.label("type"),
+        AgentEventDB.source,
+        AgentEventDB.message,
+        AgentEventDB.detail,
+        AgentEventDB.data,
+        AgentEventDB.created_at.label("time"),
+    )
+    .order_by(AgentEventDB.created_at.desc())
+    .limit(bindparam("lim"))
+)
+_EVENTS_BY_SOURCE_STMT = _EVENTS_STMT.where(AgentEventDB.source == bindparam("src"))
+
 
 @router.get("/status")
 async def get_agent_status() -> dict[str, Any]:
@@ -26,26 +47,16 @@ async def get_agent_events(
     db: DbSession,
     limit: int = Query(200, ge=1, le=1000),
     source: str | None = Query(None),
-) -> list[dict[str, Any]]:
+) -> Response:
     """Return persisted agent events (newest first)."""
-    stmt = select(AgentEventDB).order_by(AgentEventDB.created_at.desc())
     if source:
-        stmt = stmt.where(AgentEventDB.source == source)
-    stmt = stmt.limit(limit)
-    result = await db.execute(stmt)
-    rows = result.scalars().all()
-    return [
-        {
-            "id": r.id,
-            "type": r.event_type,
-            "source": r.source,
-            "message": r.message,
-            "detail": r.detail,
-            "data": r.data,
-            "time": r.created_at.isoformat() if r.created_at else "",
-        }
-        for r in rows
-    ]
+        result = await db.execute(_EVENTS_BY_SOURCE_STMT, {"src": source, "lim": limit})
+    else:
+        result = await db.execute(_EVENTS_STMT, {"lim": limit})
+    return Response(
+        orjson.dumps([dict(r) for r in result.mappings()]),
+        media_type="application/json",
+    )
 
 
 @router.post("/pause", status_code=200)
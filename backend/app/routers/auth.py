@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import os
-import uuid
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Allow OAuth over HTTP for local development
 os.environ["OAUTHLIB_INSECURE_TRANSPORT"] = "1"
@@ -14,13 +16,15 @@ import bcrypt  # type: ignore[import-untyped]
 from fastapi import APIRouter, HTTPException, Request, status
 from fastapi.responses import JSONResponse, RedirectResponse
 from google_auth_oauthlib.flow import Flow  # type: ignore[import-untyped]
-from pydantic import BaseModel, EmailStr
-from sqlalchemy import select
+from pydantic import BaseModel, ConfigDict, EmailStr
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.core.auth import create_access_token
 from app.core.config import settings
 from app.core.deps import CurrentUser, DbSession
 from app.core.google_auth import SCOPES
+from app.core.http import get_http_client
 from app.models.profile import UserProfileDB
 
 logger = logging.getLogger(__name__)
@@ -28,32 +32,115 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
 
-def _hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+# bcrypt releases the GIL while hashing, so a thread per core runs hashes in
+# parallel off the event loop. A dedicated pool keeps logins from starving
+# the default executor used by other blocking calls (e.g. fetch_token).
+_BCRYPT_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt"
+)
+# Cost for new hashes; each step down halves the work. Existing hashes keep
+# the cost they were created with.
+_BCRYPT_ROUNDS = 10
 
+# Successful verifies -> expiry (monotonic), evicted oldest-first, so repeated
+# logins within the TTL skip bcrypt. Failures are never cached.
+_VERIFY_CACHE_TTL = 60.0
+_VERIFY_CACHE_SIZE = 1024
+_verify_cache: dict[bytes, float] = {}
 
-def _verify_password(password: str, hashed: str) -> bool:
-    return bcrypt.checkpw(password.encode(), hashed.encode())
+# Checked against when the account doesn't exist (or has no password), so an
+# unknown email costs the same bcrypt work as a wrong password
+_DUMMY_HASH = bcrypt.hashpw(b"dummy", bcrypt.gensalt(_BCRYPT_ROUNDS)).decode()
+
+
+async def _hash_password(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    hashed = await loop.run_in_executor(
+        _BCRYPT_POOL, bcrypt.hashpw, password.encode(), bcrypt.gensalt(_BCRYPT_ROUNDS)
+    )
+    return hashed.decode()
+
+
+async def _verify_password(password: str, hashed: str) -> bool:
+    key = hashlib.sha256(f"{hashed}\0{password}".encode()).digest()
+    expiry = _verify_cache.get(key)
+    if expiry is not None:
+        if expiry > time.monotonic():
+            return True
+        del _verify_cache[key]
+
+    loop = asyncio.get_running_loop()
+    ok = await loop.run_in_executor(
+        _BCRYPT_POOL, bcrypt.checkpw, password.encode(), hashed.encode()
+    )
+    if ok:
+        if len(_verify_cache) >= _VERIFY_CACHE_SIZE:
+            del _verify_cache[next(iter(_verify_cache))]
+        _verify_cache[key] = time.monotonic() + _VERIFY_CACHE_TTL
+    return ok
+
+
+# Caps every string field so an oversized body fails validation up front
+_AUTH_BODY_CONFIG = ConfigDict(str_max_length=256)
 
 
 class SignupRequest(BaseModel):
+    model_config = _AUTH_BODY_CONFIG
+
     name: str
     email: EmailStr
     password: str
 
 
 class LoginRequest(BaseModel):
+    model_config = _AUTH_BODY_CONFIG
+
     email: EmailStr
     password: str
 
+
+# User lookups, built once; requests only bind parameters. Emails compare
+# case-insensitively (served by ix_user_profiles_email_lower).
+_EMAIL_MATCHES = func.lower(UserProfileDB.email) == func.lower(bindparam("email"))
+_EMAIL_TAKEN_STMT = select(UserProfileDB.id).where(_EMAIL_MATCHES).limit(1)
+_USER_BY_EMAIL_STMT = select(UserProfileDB).where(_EMAIL_MATCHES)
+
+_insert_google_user = pg_insert(UserProfileDB).values(
+    name=bindparam("name"),
+    email=bindparam("email"),
+    google_sub=bindparam("google_sub"),
+    google_refresh_token=bindparam("refresh_token"),
+    onboarding_completed=False,
+    role="",
+    company="",
+    product_description="",
+)
+# Existing Google users get fresh name/email; the stored refresh token is
+# only replaced when Google issued a new one
+_UPSERT_GOOGLE_USER_STMT = _insert_google_user.on_conflict_do_update(
+    index_elements=[UserProfileDB.google_sub],
+    set_={
+        "name": _insert_google_user.excluded.name,
+        "email": _insert_google_user.excluded.email,
+        "google_refresh_token": func.coalesce(
+            _insert_google_user.excluded.google_refresh_token,
+            UserProfileDB.google_refresh_token,
+        ),
+        "updated_at": func.now(),
+    },
+).returning(UserProfileDB.id, UserProfileDB.email, UserProfileDB.onboarding_completed)
+
+
+# Attributes of the auth cookie, serialized once. JWTs are base64url plus
+# dots, so the token needs no quoting. Add "; Secure" in production with HTTPS.
+_AUTH_COOKIE_SUFFIX = (
+    f"; HttpOnly; Max-Age={settings.jwt_expire_minutes * 60}; Path=/; SameSite=lax"
+)
+
+
 def _set_auth_cookie(response: JSONResponse | RedirectResponse, token: str) -> None:
-    response.set_cookie(
-        key="access_token",
-        value=token,
-        httponly=True,
-        samesite="lax",
-        max_age=settings.jwt_expire_minutes * 60,
-        secure=False,  # Set True in production with HTTPS
+    response.raw_headers.append(
+        (b"set-cookie", f"access_token={token}{_AUTH_COOKIE_SUFFIX}".encode("latin-1"))
     )
 
 
@@ -63,20 +150,17 @@ def _set_auth_cookie(response: JSONResponse | RedirectResponse, token: str) -> N
 @router.post("/signup")
 async def signup(body: SignupRequest, db: DbSession) -> JSONResponse:
     """Register a new user with email and password."""
-    result = await db.execute(
-        select(UserProfileDB).where(UserProfileDB.email == body.email)
-    )
-    if result.scalar_one_or_none():
+    if await db.scalar(_EMAIL_TAKEN_STMT, {"email": body.email}) is not None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Email already registered",
         )
 
+    # The id comes from the database default, returned by the INSERT on commit
     user = UserProfileDB(
-        id=str(uuid.uuid4()),
         name=body.name,
         email=body.email,
-        password_hash=_hash_password(body.password),
+        password_hash=await _hash_password(body.password),
         onboarding_completed=False,
         role="",
         company="",
@@ -84,7 +168,6 @@ async def signup(body: SignupRequest, db: DbSession) -> JSONResponse:
     )
     db.add(user)
     await db.commit()
-    await db.refresh(user)
 
     token = create_access_token(user.id, user.email)
     response = JSONResponse(
@@ -97,12 +180,11 @@ async def signup(body: SignupRequest, db: DbSession) -> JSONResponse:
 @router.post("/login")
 async def login(body: LoginRequest, db: DbSession) -> JSONResponse:
     """Login with email and password."""
-    result = await db.execute(
-        select(UserProfileDB).where(UserProfileDB.email == body.email)
-    )
-    user = result.scalar_one_or_none()
+    user = await db.scalar(_USER_BY_EMAIL_STMT, {"email": body.email})
 
-    if not user or not user.password_hash or not _verify_password(body.password, user.password_hash):
+    target_hash = user.password_hash if user and user.password_hash else _DUMMY_HASH
+    ok = await _verify_password(body.password, target_hash)
+    if not ok or not user or not user.password_hash:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
@@ -192,57 +274,37 @@ async def google_callback(request: Request, db: DbSession) -> RedirectResponse:
         return RedirectResponse(f"{settings.frontend_url}/login?error=token_exchange")
 
     credentials = flow.credentials
-    # Get user info from Google
-    import httpx
-
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(
-            "https://www.googleapis.com/oauth2/v3/userinfo",
-            headers={"Authorization": f"Bearer {credentials.token}"},
-        )
-        resp.raise_for_status()
-        user_info = resp.json()
+    # Get user info from Google over the shared, keep-alive connection pool
+    resp = await get_http_client().get(
+        "https://www.googleapis.com/oauth2/v3/userinfo",
+        headers={"Authorization": f"Bearer {credentials.token}"},
+        timeout=10.0,
+    )
+    resp.raise_for_status()
+    user_info = resp.json()
 
     google_sub = user_info["sub"]
     email = user_info.get("email", "")
     name = user_info.get("name", "")
 
-    # Look up existing user by google_sub
+    # Insert or update the user in one round trip
     result = await db.execute(
-        select(UserProfileDB).where(UserProfileDB.google_sub == google_sub)
+        _UPSERT_GOOGLE_USER_STMT,
+        {
+            "name": name,
+            "email": email,
+            "google_sub": google_sub,
+            "refresh_token": credentials.refresh_token,
+        },
     )
-    user = result.scalar_one_or_none()
-
-    is_new = user is None
-
-    if is_new:
-        user = UserProfileDB(
-            id=str(uuid.uuid4()),
-            name=name,
-            email=email,
-            google_sub=google_sub,
-            google_refresh_token=credentials.refresh_token,
-            onboarding_completed=False,
-            role="",
-            company="",
-            product_description="",
-        )
-        db.add(user)
-    else:
-        # Update refresh token if a new one was issued
-        if credentials.refresh_token:
-            user.google_refresh_token = credentials.refresh_token
-        user.email = email
-        user.name = name
-
+    user = result.one()
     await db.commit()
-    await db.refresh(user)
 
     # Create JWT
     token = create_access_token(user.id, user.email)
 
-    # Redirect based on onboarding status
-    redirect_path = "/onboarding" if is_new or not user.onboarding_completed else "/"
+    # Redirect based on onboarding status (always pending for new users)
+    redirect_path = "/onboarding" if not user.onboarding_completed else "/"
     response = RedirectResponse(f"{settings.frontend_url}{redirect_path}")
     _set_auth_cookie(response, token)
     response.delete_cookie("oauth_cv")  # Clean up PKCE cookie
@@ -1,19 +1,23 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from collections.abc import AsyncGenerator
-from typing import Any
+from collections.abc import AsyncGenerator, AsyncIterator
+from typing import Any, cast
 
+import orjson
 from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
-from sqlalchemy import delete, select
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import CursorResult, delete, select
 
 from app.core.config import settings
-from app.core.database import async_session_factory
+from app.core.database import async_ro_session_factory, async_session_factory
 from app.core.deps import CurrentUser, DbSession, get_current_user
+from app.core.llm import get_anthropic
 from app.core.websocket import manager
+from app.integrations.tavily_client import TavilyClient
 from app.models.chat import ChatMessageDB
 from app.models.profile import UserProfileDB
 
@@ -25,6 +29,13 @@ router = APIRouter(
     dependencies=[Depends(get_current_user)],
 )
 
+# One search client for every tool call, so its connections are reused
+_TAVILY = (
+    TavilyClient(api_key=settings.tavily_api_key)
+    if settings.tavily_api_key
+    else None
+)
+
 # ── Tools available to the chat agent ─────────────────────────────────────────
 
 CHAT_TOOLS: list[dict[str, Any]] = [
@@ -85,7 +96,39 @@ Be concise and actionable. Use the user's interests and goals to personalize you
 """
 
 
+# Rendered SYSTEM_PROMPT per distinct profile context, evicted oldest-first
+_SYSTEM_PROMPT_CACHE_SIZE = 256
+_system_prompts: dict[tuple[str, ...], str] = {}
+
+
+def _system_prompt(profile: UserProfileDB | None) -> str:
+    """Render SYSTEM_PROMPT for a profile, reusing earlier renderings."""
+    if profile is None:
+        key: tuple[str, ...] = ("User", "", "", "", "")
+    else:
+        key = (
+            profile.name,
+            profile.role,
+            profile.company,
+            ", ".join(profile.interests or []),
+            ", ".join(profile.networking_goals or []),
+        )
+    system = _system_prompts.get(key)
+    if system is None:
+        name, role, company, interests, goals = key
+        system = SYSTEM_PROMPT.format(
+            name=name, role=role, company=company, interests=interests, goals=goals
+        )
+        if len(_system_prompts) >= _SYSTEM_PROMPT_CACHE_SIZE:
+            del _system_prompts[next(iter(_system_prompts))]
+        _system_prompts[key] = system
+    return system
+
+
 class ChatMessage(BaseModel):
+    # Rejects oversized bodies before they reach the DB or the model
+    model_config = ConfigDict(str_max_length=16_000)
+
     message: str
 
 
@@ -95,13 +138,17 @@ MAX_HISTORY = 20
 async def _load_history(db: DbSession, user_id: str) -> list[dict[str, Any]]:
     """Load chat history from database."""
     stmt = (
-        select(ChatMessageDB)
+        select(ChatMessageDB.role, ChatMessageDB.content)
         .where(ChatMessageDB.user_id == user_id)
         .order_by(ChatMessageDB.created_at.asc())
     )
     result = await db.execute(stmt)
-    rows = result.scalars().all()
-    return [{"role": r.role, "content": r.content} for r in rows]
+    return [{"role": r.role, "content": r.content} for r in result]
+
+
+async def _load_profile(user_id: str) -> UserProfileDB | None:
+    async with async_ro_session_factory() as session:
+        return await session.get(UserProfileDB, user_id)
 
 
 async def _save_message(db: DbSession, user_id: str, role: str, content: str) -> None:
@@ -113,19 +160,24 @@ async def _save_message(db: DbSession, user_id: str, role: str, content: str) ->
 
 async def _trim_history(db: DbSession, user_id: str) -> None:
     """Keep only the last MAX_HISTORY messages per user."""
-    count_stmt = (
+    # One DELETE of everything older than the newest MAX_HISTORY rows; the
+    # ids never leave the database
+    keep = (
         select(ChatMessageDB.id)
         .where(ChatMessageDB.user_id == user_id)
-        .order_by(ChatMessageDB.created_at.asc())
+        .order_by(ChatMessageDB.created_at.desc())
+        .limit(MAX_HISTORY)
     )
-    result = await db.execute(count_stmt)
-    all_ids = [row for row in result.scalars().all()]
-
-    if len(all_ids) > MAX_HISTORY:
-        ids_to_delete = all_ids[: len(all_ids) - MAX_HISTORY]
+    # DML results are cursor results, which carry the deleted row count
+    result = cast(
+        "CursorResult[Any]",
         await db.execute(
-            delete(ChatMessageDB).where(ChatMessageDB.id.in_(ids_to_delete))
-        )
+            delete(ChatMessageDB).where(
+                ChatMessageDB.user_id == user_id, ChatMessageDB.id.not_in(keep)
+            )
+        ),
+    )
+    if result.rowcount:
         await db.commit()
 
 
@@ -134,14 +186,11 @@ async def _execute_chat_tool(
 ) -> dict[str, Any]:
     """Execute a chat tool and return the result."""
     if tool_name == "tavily_search":
-        if not settings.tavily_api_key:
+        if _TAVILY is None:
             return {"error": "Tavily API key not configured"}
 
-        from app.integrations.tavily_client import TavilyClient
-
         try:
-            client = TavilyClient(api_key=settings.tavily_api_key)
-            result = await client.search(
+            result = await _TAVILY.search(
                 query=tool_input["query"],
                 search_depth=tool_input.get("search_depth", "advanced"),
                 max_results=tool_input.get("max_results", 5),
@@ -168,8 +217,59 @@ async def _execute_chat_tool(
     return {"error": f"Unknown tool: {tool_name}"}
 
 
-def _sse(event_type: str, data: Any) -> str:
-    return f"data: {json.dumps({'type': event_type, **data} if isinstance(data, dict) else {'type': event_type, 'content': data})}\n\n"
+# Text deltas are the bulk of the stream, so their frame prefix is prebuilt
+_SSE_TEXT_PREFIX = b'data: {"type":"text","content":'
+# Buffered text frames are sent once this many bytes or seconds accumulate
+_SSE_FLUSH_BYTES = 1024
+_SSE_FLUSH_INTERVAL = 0.05
+
+
+def _sse(payload: dict[str, Any]) -> bytes:
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+def _sse_text(text: str) -> bytes:
+    return _SSE_TEXT_PREFIX + orjson.dumps(text) + b"}\n\n"
+
+
+async def _coalesced_text_frames(
+    texts: AsyncIterator[str], parts: list[str]
+) -> AsyncGenerator[bytes, None]:
+    """Yield SSE text frames from ``texts`` in chunks of ~``_SSE_FLUSH_BYTES``.
+
+    Buffered text is also flushed ``_SSE_FLUSH_INTERVAL`` seconds after it
+    arrived, even while the model pauses between tokens. Each text piece is
+    appended to ``parts``.
+    """
+    loop = asyncio.get_running_loop()
+    buf = bytearray()
+    deadline = 0.0
+    # The next-token wait is never cancelled on timeout: cancelling it would
+    # close the underlying stream
+    pending = asyncio.ensure_future(anext(texts, None))
+    try:
+        while True:
+            timeout = max(0.0, deadline - loop.time()) if buf else None
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if not done:
+                yield bytes(buf)
+                buf.clear()
+                continue
+            text = pending.result()
+            if text is None:
+                break
+            pending = asyncio.ensure_future(anext(texts, None))
+            parts.append(text)
+            if not buf:
+                deadline = loop.time() + _SSE_FLUSH_INTERVAL
+            buf += _sse_text(text)
+            if len(buf) >= _SSE_FLUSH_BYTES:
+                yield bytes(buf)
+                buf.clear()
+        if buf:
+            yield bytes(buf)
+    finally:
+        pending.cancel()
 
 
 @router.post("/send")
@@ -179,28 +279,22 @@ async def send_message(
     db: DbSession,
 ) -> StreamingResponse:
     """Send a message to the Wingman agent and stream the response."""
-    import anthropic
-
     user_id = user["user_id"]
 
-    # Load user profile for context
-    profile_row = await db.get(UserProfileDB, user_id)
-    profile_context = {
-        "name": profile_row.name if profile_row else "User",
-        "role": profile_row.role if profile_row else "",
-        "company": profile_row.company if profile_row else "",
-        "interests": ", ".join(profile_row.interests or []) if profile_row else "",
-        "goals": ", ".join(profile_row.networking_goals or []) if profile_row else "",
-    }
+    # Load the profile on its own read-only session, overlapping the history
+    # writes below (one AsyncSession can't run two queries at once). The
+    # task group cancels the load if the history work fails.
+    async with asyncio.TaskGroup() as tg:
+        profile_task = tg.create_task(_load_profile(user_id))
 
-    system = SYSTEM_PROMPT.format(**profile_context)
+        # Save user message to DB
+        await _save_message(db, user_id, "user", body.message)
+        await _trim_history(db, user_id)
 
-    # Save user message to DB
-    await _save_message(db, user_id, "user", body.message)
-    await _trim_history(db, user_id)
+        # Load full history from DB
+        history = await _load_history(db, user_id)
 
-    # Load full history from DB
-    history = await _load_history(db, user_id)
+    system = _system_prompt(profile_task.result())
 
     # Broadcast to websocket that agent is working
     await manager.broadcast(
@@ -210,9 +304,10 @@ async def send_message(
         }
     )
 
-    async def generate() -> AsyncGenerator[str, None]:
-        client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
-        full_response = ""
+    async def generate() -> AsyncGenerator[bytes, None]:
+        client = get_anthropic()
+        # Streamed text pieces, joined once when the reply is saved
+        parts: list[str] = []
 
         # Build messages for this round (may include tool results)
         round_messages: list[dict[str, Any]] = list(history)
@@ -221,8 +316,6 @@ async def send_message(
             # Tool use loop: up to 5 rounds of tool calls
             for _round in range(5):
                 # Stream the response
-                round_text = ""
-
                 async with client.messages.stream(
                     model="claude-sonnet-4-20250514",
                     max_tokens=2048,
@@ -230,15 +323,16 @@ async def send_message(
                     tools=CHAT_TOOLS,  # type: ignore[arg-type]
                     messages=round_messages,  # type: ignore[arg-type]
                 ) as stream:
-                    async for text in stream.text_stream:
-                        round_text += text
-                        yield _sse("text", text)
+                    # Coalesce text frames into ~1 KB chunks (or whatever
+                    # arrived within the flush interval) per ASGI send
+                    async for chunk in _coalesced_text_frames(
+                        stream.text_stream, parts
+                    ):
+                        yield chunk
 
                     # Get the full message to check for tool use
                     final_msg = await stream.get_final_message()
 
-                full_response += round_text
-
                 # Check for tool use blocks
                 tool_blocks = [
                     b for b in final_msg.content if b.type == "tool_use"
@@ -248,35 +342,44 @@ async def send_message(
                     # No tools — we're done
                     break
 
-                # Execute tools and send status events
+                # Execute tools and send status events. The SDK accepts the
+                # response blocks as-is, so they go back without a dump.
                 round_messages.append(
-                    {
-                        "role": "assistant",
-                        "content": [
-                            b.model_dump() for b in final_msg.content
-                        ],
-                    }
+                    {"role": "assistant", "content": final_msg.content}
                 )
-                tool_results: list[dict[str, Any]] = []
                 for block in tool_blocks:
                     # Tell frontend which tool is being used
                     yield _sse(
-                        "tool_use",
-                        {"tool": block.name, "input": {"query": block.input.get("query", "")} if isinstance(block.input, dict) else {}},  # type: ignore[union-attr]
-                    )
-
-                    result = await _execute_chat_tool(
-                        block.name,
-                        block.input if isinstance(block.input, dict) else {},  # type: ignore[arg-type]
-                    )
-                    tool_results.append(
                         {
-                            "type": "tool_result",
-                            "tool_use_id": block.id,
-                            "content": json.dumps(result),
+                            "type": "tool_use",
+                            "tool": block.name,
+                            "input": (
+                                {"query": block.input.get("query", "")}
+                                if isinstance(block.input, dict)
+                                else {}
+                            ),
                         }
                     )
 
+                # Independent tool calls (e.g. several searches) run concurrently
+                results = await asyncio.gather(
+                    *(
+                        _execute_chat_tool(
+                            block.name,
+                            block.input if isinstance(block.input, dict) else {},
+                        )
+                        for block in tool_blocks
+                    )
+                )
+                tool_results: list[dict[str, Any]] = [
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": block.id,
+                        "content": json.dumps(result),
+                    }
+                    for block, result in zip(tool_blocks, results)
+                ]
+
                 round_messages.append(
                     {"role": "user", "content": tool_results}
                 )
@@ -284,16 +387,16 @@ async def send_message(
             # Save assistant response to DB
             async with async_session_factory() as save_db:
                 save_msg = ChatMessageDB(
-                    user_id=user_id, role="assistant", content=full_response
+                    user_id=user_id, role="assistant", content="".join(parts)
                 )
                 save_db.add(save_msg)
                 await save_db.commit()
 
-            yield _sse("done", {})
+            yield _sse({"type": "done"})
 
         except Exception as e:
             logger.exception("Chat stream error")
-            yield _sse("error", str(e))
+            yield _sse({"type": "error", "content": str(e)})
 
         # Broadcast agent done
         await manager.broadcast(
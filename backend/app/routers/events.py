@@ -1,3 +1,9 @@
+import asyncio
+import uuid
+from collections import defaultdict
+from itertools import islice
+from typing import Any
+
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select
 
@@ -16,20 +22,48 @@ router = APIRouter(
     dependencies=[Depends(get_current_user)],
 )
 
+# REKA calls in flight per analyze-connections request
+_ANALYZE_CONCURRENCY = 8
+
 # In-memory store for hackathon MVP
 _events: dict[str, dict] = {}
+# Secondary index: status -> {event_id: event}, kept in step by _set_status.
+# Buckets are in the order events entered that status, not creation order.
+_events_by_status: defaultdict[str, dict[str, dict[str, Any]]] = defaultdict(dict)
+
+
+def _set_status(event_id: str, new_status: str) -> dict[str, Any]:
+    """Set an event's status, moving it to the matching index bucket."""
+    event = _events.setdefault(event_id, {"id": event_id})
+    old_status = event.get("status")
+    if old_status is not None:
+        _events_by_status[old_status].pop(event_id, None)
+    event["status"] = new_status
+    _events_by_status[new_status][event_id] = event
+    return event
+
+
+def _is_uuid(value: str) -> bool:
+    try:
+        uuid.UUID(value)
+    except ValueError:
+        return False
+    return True
 
 
 @router.get("")
 async def list_events(
     status: EventStatus | None = None,
-    limit: int = 20,
-    offset: int = 0,
+    limit: int = Query(20, ge=0),
+    offset: int = Query(0, ge=0),
 ) -> list[dict]:
-    events = list(_events.values())
-    if status:
-        events = [e for e in events if e.get("status") == status]
-    return events[offset : offset + limit]
+    """List events, optionally filtered by status.
+
+    Unfiltered listings are in creation order; filtered ones in the order
+    events reached that status (most recently changed last).
+    """
+    events = _events_by_status.get(status.value, {}) if status else _events
+    return list(islice(events.values(), offset, offset + limit))
 
 
 @router.get("/{event_id}")
@@ -43,7 +77,7 @@ async def get_event(event_id: str) -> dict:
 async def accept_event(event_id: str) -> dict:
     if event_id not in _events:
         raise HTTPException(status_code=404, detail="Event not found")
-    _events[event_id]["status"] = "accepted"
+    _set_status(event_id, "accepted")
     return {"status": "accepted", "event_id": event_id}
 
 
@@ -51,8 +85,7 @@ async def accept_event(event_id: str) -> dict:
 async def reject_event(event_id: str, body: dict) -> dict:
     if event_id not in _events:
         raise HTTPException(status_code=404, detail="Event not found")
-    _events[event_id]["status"] = "rejected"
-    _events[event_id]["rejection_reason"] = body.get("reason", "")
+    _set_status(event_id, "rejected")["rejection_reason"] = body.get("reason", "")
     return {"status": "rejected", "event_id": event_id}
 
 
@@ -60,7 +93,7 @@ async def reject_event(event_id: str, body: dict) -> dict:
 async def apply_to_event(event_id: str) -> dict:
     if event_id not in _events:
         raise HTTPException(status_code=404, detail="Event not found")
-    _events[event_id]["status"] = "applied"
+    _set_status(event_id, "applied")
     return {"status": "applied", "event_id": event_id}
 
 
@@ -73,17 +106,13 @@ async def get_event_people(event_id: str) -> list[dict]:
 
 @router.post("/{event_id}/attend", status_code=200)
 async def attend_event(event_id: str) -> dict:
-    if event_id not in _events:
-        _events[event_id] = {"id": event_id}
-    _events[event_id]["status"] = "attended"
+    _set_status(event_id, "attended")
     return {"status": "attended", "event_id": event_id}
 
 
 @router.post("/{event_id}/skip-attend", status_code=200)
 async def skip_attend_event(event_id: str) -> dict:
-    if event_id not in _events:
-        _events[event_id] = {"id": event_id}
-    _events[event_id]["status"] = "skipped"
+    _set_status(event_id, "skipped")
     return {"status": "skipped", "event_id": event_id}
 
 
@@ -110,14 +139,19 @@ async def analyze_event_connections(event_id: str) -> list[dict]:
     if event_id not in _events:
         return []
     connections = _events[event_id].get("connections", [])
-    results = []
-    for conn in connections:
-        profile = await analyze_linkedin_profile(
-            name=conn.get("name", ""),
-            linkedin_url=conn.get("linkedin_url", ""),
-            notes=conn.get("notes", ""),
-        )
-        results.append(profile)
+    limit = asyncio.Semaphore(_ANALYZE_CONCURRENCY)
+
+    async def analyze(conn: dict[str, Any]) -> dict[str, Any]:
+        async with limit:
+            return await analyze_linkedin_profile(
+                name=conn.get("name", ""),
+                linkedin_url=conn.get("linkedin_url", ""),
+                notes=conn.get("notes", ""),
+            )
+
+    # Each call falls back to a basic profile on error, so results stay
+    # one-to-one with connections
+    results = list(await asyncio.gather(*(analyze(c) for c in connections)))
     _events[event_id]["analyzed_connections"] = results
     return results
 
@@ -157,26 +191,28 @@ async def get_participants(event_id: str, db: DbSession) -> list[dict]:
         event_url = _events[event_id]["url"]
 
     # Fall back to AgentEventDB — find agent event with matching ID and extract URL
-    if not event_url:
-        stmt = select(AgentEventDB).where(AgentEventDB.id == event_id)
+    # (ids are UUID columns; in-memory ids like "evt-1" can't match)
+    if not event_url and _is_uuid(event_id):
+        # Only the JSON payload is needed; skip the text columns
+        stmt = select(AgentEventDB.data).where(AgentEventDB.id == event_id)
         result = await db.execute(stmt)
-        row = result.scalar_one_or_none()
-        if row and row.data:
-            ev = row.data.get("event", {})
+        data = result.scalar_one_or_none()
+        if data:
+            ev = data.get("event", {})
             event_url = ev.get("url", "")
 
     # Also try matching by event URL pattern in all applied events
     if not event_url:
         stmt = (
-            select(AgentEventDB)
+            select(AgentEventDB.data)
             .where(AgentEventDB.event_type == "event:applied")
             .order_by(AgentEventDB.created_at.desc())
             .limit(10)
         )
         result = await db.execute(stmt)
-        for row in result.scalars():
-            if row.data:
-                ev = row.data.get("event", {})
+        for data in result.scalars():
+            if data:
+                ev = data.get("event", {})
                 if ev.get("url"):
                     event_url = ev["url"]
                     break
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -235,7 +234,6 @@ async def seed_demo(request: Request) -> dict[str, Any]:
         async with async_session_factory() as session:
             for ae in agent_events:
                 session.add(AgentEventDB(
-                    id=str(uuid.uuid4()),
                     event_type=ae["event_type"],
                     source="nexus",
                     message=ae["message"],
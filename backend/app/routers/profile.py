@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 
+from app.core.agent_manager import agent_manager
 from app.core.deps import CurrentUser, DbSession, get_current_user
 from app.models.profile import UserProfileDB
 
@@ -65,7 +66,7 @@ async def update_profile(body: dict, user: CurrentUser, db: DbSession) -> dict:
         profile.onboarding_completed = True
 
     await db.commit()
-    await db.refresh(profile)
+    agent_manager.invalidate_profile_cache()
     return {"status": "updated", "id": profile.id}
 
 
@@ -104,5 +105,5 @@ async def update_preferences(body: dict, user: CurrentUser, db: DbSession) -> di
             setattr(profile, field, body[field])
 
     await db.commit()
-    await db.refresh(profile)
+    agent_manager.invalidate_profile_cache()
     return {"status": "updated"}
@@ -43,6 +43,10 @@ def mock_neo4j() -> AsyncMock:
     neo4j.merge_company = AsyncMock(return_value=[])
     neo4j.merge_topic = AsyncMock(return_value=[])
     neo4j.create_relationship = AsyncMock(return_value=[])
+    neo4j.merge_persons = AsyncMock(return_value=[])
+    neo4j.merge_companies = AsyncMock(return_value=[])
+    neo4j.merge_topics = AsyncMock(return_value=[])
+    neo4j.create_relationships = AsyncMock(return_value=[])
     return neo4j
 
 
@@ -124,12 +128,29 @@ async def test_update_knowledge_graph_calls_merge_methods(
     await agent.update_knowledge_graph(enriched)
 
     mock_neo4j.merge_event.assert_called_once()
-    assert mock_neo4j.merge_person.call_count == 2
-    # 2 speaker companies + 2 companies list entries (Sequoia, a16z appear in both)
-    assert mock_neo4j.merge_company.call_count >= 2
-    assert mock_neo4j.merge_topic.call_count == 2
-    # SPEAKS_AT for each speaker + WORKS_AT for each speaker with company + TAGGED for each topic
-    assert mock_neo4j.create_relationship.call_count >= 4
+    # One batched write per node kind, duplicates collapsed
+    mock_neo4j.merge_persons.assert_awaited_once()
+    assert [p["name"] for p in mock_neo4j.merge_persons.call_args.args[0]] == [
+        "Sarah Chen",
+        "James Liu",
+    ]
+    mock_neo4j.merge_companies.assert_awaited_once_with(
+        [{"name": "Sequoia"}, {"name": "a16z"}]
+    )
+    mock_neo4j.merge_topics.assert_awaited_once_with(
+        [{"name": "AI agents"}, {"name": "fundraising"}]
+    )
+    mock_neo4j.merge_person.assert_not_called()
+    mock_neo4j.create_relationship.assert_not_called()
+
+    # SPEAKS_AT, WORKS_AT and TAGGED each go out as one batch
+    rels = {
+        c.args[2]: c.args[5] for c in mock_neo4j.create_relationships.call_args_list
+    }
+    url = "https://lu.ma/ai-dinner-sf"
+    assert rels["SPEAKS_AT"] == [("Sarah Chen", url), ("James Liu", url)]
+    assert rels["WORKS_AT"] == [("Sarah Chen", "Sequoia"), ("James Liu", "a16z")]
+    assert rels["TAGGED"] == [(url, "AI agents"), (url, "fundraising")]
 
 
 @pytest.mark.asyncio
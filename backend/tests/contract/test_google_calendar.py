@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.integrations.google_calendar import GoogleCalendarClient
+
+
+# -- Tests ---------------------------------------------------------------------
+
+
+class TestGoogleCalendarService:
+    @pytest.mark.asyncio
+    async def test_service_is_built_once(self) -> None:
+        with patch("app.integrations.google_calendar.build") as mock_build:
+            service = MagicMock()
+            service.events().list().execute.return_value = {"items": []}
+            mock_build.return_value = service
+
+            client = GoogleCalendarClient(credentials=MagicMock())
+            now = datetime(2026, 3, 1)
+            await client.list_upcoming(now, now)
+            await client.list_upcoming(now, now)
+
+            mock_build.assert_called_once()
+            assert mock_build.call_args.kwargs["static_discovery"] is True
@@ -11,18 +11,14 @@ from app.integrations.neo4j_client import Neo4jClient
 
 
 def _make_mock_driver() -> MagicMock:
-    """Create a mock AsyncDriver with session/run/data chain."""
-    mock_result = AsyncMock()
-    mock_result.data = AsyncMock(return_value=[{"n": {"name": "test"}}])
-    mock_result.consume = AsyncMock()
-
-    mock_session = AsyncMock()
-    mock_session.run = AsyncMock(return_value=mock_result)
-    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-    mock_session.__aexit__ = AsyncMock(return_value=False)
+    """Create a mock AsyncDriver whose execute_query returns one record."""
+    mock_record = MagicMock()
+    mock_record.data.return_value = {"n": {"name": "test"}}
 
     mock_driver = AsyncMock()
-    mock_driver.session = MagicMock(return_value=mock_session)
+    mock_driver.execute_query = AsyncMock(
+        return_value=([mock_record], MagicMock(), ["n"])
+    )
     mock_driver.close = AsyncMock()
 
     return mock_driver
@@ -67,6 +63,29 @@ class TestNeo4jClientConnection:
 
             assert MockGDB.driver.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_connect_passes_pool_settings(self) -> None:
+        with patch(
+            "app.integrations.neo4j_client.AsyncGraphDatabase"
+        ) as MockGDB:
+            MockGDB.driver.return_value = _make_mock_driver()
+
+            client = Neo4jClient(
+                uri="bolt://localhost:7687",
+                user="neo4j",
+                password="test",
+                max_pool_size=50,
+                acquisition_timeout=60.0,
+            )
+            await client.connect()
+
+            MockGDB.driver.assert_called_once_with(
+                "bolt://localhost:7687",
+                auth=("neo4j", "test"),
+                max_connection_pool_size=50,
+                connection_acquisition_timeout=60.0,
+            )
+
     @pytest.mark.asyncio
     async def test_disconnect_closes_driver(self) -> None:
         with patch(
@@ -118,10 +137,9 @@ class TestNeo4jClientQuery:
                 {"name": "Sarah Chen"},
             )
 
-            session = mock_driver.session.return_value
-            session.run.assert_called_once_with(
+            mock_driver.execute_query.assert_awaited_once_with(
                 "MATCH (n:Person) WHERE n.name = $name RETURN n",
-                {"name": "Sarah Chen"},
+                parameters_={"name": "Sarah Chen"},
             )
             assert results == [{"n": {"name": "test"}}]
 
@@ -162,10 +180,9 @@ class TestNeo4jClientMerge:
                 {"url": "https://lu.ma/ai-dinner", "title": "AI Dinner"}
             )
 
-            session = mock_driver.session.return_value
-            call_args = session.run.call_args
+            call_args = mock_driver.execute_query.call_args
             assert "MERGE (e:Event {url: $url})" in call_args[0][0]
-            assert call_args[0][1]["url"] == "https://lu.ma/ai-dinner"
+            assert call_args.kwargs["parameters_"]["url"] == "https://lu.ma/ai-dinner"
 
     @pytest.mark.asyncio
     async def test_merge_person(self) -> None:
@@ -183,10 +200,9 @@ class TestNeo4jClientMerge:
                 {"name": "Sarah Chen", "title": "Partner", "company": "Sequoia"}
             )
 
-            session = mock_driver.session.return_value
-            call_args = session.run.call_args
+            call_args = mock_driver.execute_query.call_args
             assert "MERGE (p:Person {name: $name})" in call_args[0][0]
-            assert call_args[0][1]["name"] == "Sarah Chen"
+            assert call_args.kwargs["parameters_"]["name"] == "Sarah Chen"
 
     @pytest.mark.asyncio
     async def test_merge_company(self) -> None:
@@ -202,8 +218,7 @@ class TestNeo4jClientMerge:
             await client.connect()
             await client.merge_company({"name": "Sequoia", "industry": "VC"})
 
-            session = mock_driver.session.return_value
-            call_args = session.run.call_args
+            call_args = mock_driver.execute_query.call_args
             assert "MERGE (c:Company {name: $name})" in call_args[0][0]
 
     @pytest.mark.asyncio
@@ -220,10 +235,49 @@ class TestNeo4jClientMerge:
             await client.connect()
             await client.merge_topic({"name": "AI Agents", "category": "tech"})
 
-            session = mock_driver.session.return_value
-            call_args = session.run.call_args
+            call_args = mock_driver.execute_query.call_args
             assert "MERGE (t:Topic {name: $name})" in call_args[0][0]
 
+    @pytest.mark.asyncio
+    async def test_merge_persons_single_unwind_query(self) -> None:
+        with patch(
+            "app.integrations.neo4j_client.AsyncGraphDatabase"
+        ) as MockGDB:
+            mock_driver = _make_mock_driver()
+            MockGDB.driver.return_value = mock_driver
+
+            client = Neo4jClient(
+                uri="bolt://localhost:7687", user="neo4j", password="test"
+            )
+            await client.connect()
+            rows = [{"name": "Sarah Chen"}, {"name": "James Liu"}]
+            await client.merge_persons(rows)
+
+            mock_driver.execute_query.assert_awaited_once()
+            call_args = mock_driver.execute_query.call_args
+            assert "UNWIND $rows AS row" in call_args[0][0]
+            assert "MERGE (n:Person {name: row.name})" in call_args[0][0]
+            assert call_args.kwargs["parameters_"]["rows"] == rows
+
+    @pytest.mark.asyncio
+    async def test_merge_many_empty_skips_query(self) -> None:
+        with patch(
+            "app.integrations.neo4j_client.AsyncGraphDatabase"
+        ) as MockGDB:
+            mock_driver = _make_mock_driver()
+            MockGDB.driver.return_value = mock_driver
+
+            client = Neo4jClient(
+                uri="bolt://localhost:7687", user="neo4j", password="test"
+            )
+            await client.connect()
+
+            assert await client.merge_companies([]) == []
+            assert await client.create_relationships(
+                "Event", "url", "TAGGED", "Topic", "name", []
+            ) == []
+            mock_driver.execute_query.assert_not_called()
+
 
 class TestNeo4jClientRelationship:
     @pytest.mark.asyncio
@@ -249,8 +303,7 @@ class TestNeo4jClientRelationship:
                 properties={"since": "2020"},
             )
 
-            session = mock_driver.session.return_value
-            call_args = session.run.call_args
+            call_args = mock_driver.execute_query.call_args
             cypher = call_args[0][0]
             assert "MATCH (a:Person {name: $from_val})" in cypher
             assert "MATCH (b:Company {name: $to_val})" in cypher
@@ -279,6 +332,32 @@ class TestNeo4jClientRelationship:
                 to_value="Sarah Chen",
             )
 
-            session = mock_driver.session.return_value
-            cypher = session.run.call_args[0][0]
+            cypher = mock_driver.execute_query.call_args[0][0]
             assert "SET r += $props" not in cypher
+
+    @pytest.mark.asyncio
+    async def test_create_relationships_unwinds_pairs(self) -> None:
+        with patch(
+            "app.integrations.neo4j_client.AsyncGraphDatabase"
+        ) as MockGDB:
+            mock_driver = _make_mock_driver()
+            MockGDB.driver.return_value = mock_driver
+
+            client = Neo4jClient(
+                uri="bolt://localhost:7687", user="neo4j", password="test"
+            )
+            await client.connect()
+            await client.create_relationships(
+                "Person", "name", "WORKS_AT", "Company", "name",
+                [("Sarah Chen", "Sequoia"), ("James Liu", "a16z")],
+            )
+
+            call_args = mock_driver.execute_query.call_args
+            cypher = call_args[0][0]
+            assert "UNWIND $pairs AS pair" in cypher
+            assert "MATCH (a:Person {name: pair[0]})" in cypher
+            assert "MERGE (a)-[r:WORKS_AT]->(b)" in cypher
+            assert call_args.kwargs["parameters_"]["pairs"] == [
+                ["Sarah Chen", "Sequoia"],
+                ["James Liu", "a16z"],
+            ]
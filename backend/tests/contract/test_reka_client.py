@@ -61,6 +61,14 @@ class TestRekaClientInit:
         with pytest.raises(ValueError, match="reka_api_key is required"):
             RekaClient(api_key="")
 
+    def test_clients_share_one_connection_pool(self) -> None:
+        from app.integrations.yutori_client import YutoriClient
+
+        a = RekaClient(api_key="reka-a")
+        b = RekaClient(api_key="reka-b")
+        assert a.http is b.http
+        assert YutoriClient(api_key="yut").http is a.http
+
 
 class TestRekaAnalyze:
     @respx.mock
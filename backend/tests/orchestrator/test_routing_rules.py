@@ -6,12 +6,19 @@ integration client method and that unknown tools return an error dict.
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
 
-from app.agents.orchestrator import NexusAgent
+from app.agents.orchestrator import (
+    _TOOL_CONCURRENCY,
+    NexusAgent,
+    _is_transient_tool_error,
+    _tool_call_key,
+)
 from app.core.config import NexusMode
 from app.integrations.reka_client import RekaVisionResult
 from app.integrations.tavily_client import TavilySearchResult
@@ -212,6 +219,24 @@ class TestResolveSocialRouting:
         # Should have called tavily search at least once (LinkedIn + Twitter)
         assert mock_tavily.search.await_count >= 1
 
+    @pytest.mark.asyncio
+    async def test_one_failed_lookup_keeps_the_other(
+        self, agent: NexusAgent, mock_tavily: AsyncMock
+    ) -> None:
+        found = TavilySearchResult(
+            query="q",
+            answer=None,
+            results=[{"url": "https://x.com/jdoe"}],
+            raw_content=[],
+        )
+        mock_tavily.search.side_effect = [httpx.ReadTimeout("slow"), found]
+        result = await agent.execute_tool(
+            "resolve_social_accounts",
+            {"name": "John Doe", "company": "Acme"},
+        )
+        assert result["social_links"]["linkedin"] is None
+        assert result["social_links"]["twitter"] == "https://x.com/jdoe"
+
 
 class TestDraftMessageRouting:
     @pytest.mark.asyncio
@@ -267,10 +292,57 @@ class TestNotifyUserRouting:
                 "priority": "high",
             },
         )
+        await agent.flush_ws_events()
         ws_broadcast.assert_awaited_once()
         assert result["status"] == "notified"
         assert result["priority"] == "high"
 
+    @pytest.mark.asyncio
+    async def test_suggested_event_context_is_saved(
+        self, test_user_profile: dict
+    ) -> None:
+        save = AsyncMock()
+        agent = NexusAgent(
+            user_profile=test_user_profile,
+            mode=NexusMode.LIVE,
+            save_event_context=save,
+        )
+        event = {"title": "AI Night", "date": "2026-03-01", "location": "SF"}
+        await agent.execute_tool(
+            "notify_user", {"type": "event_suggested", "data": {"event": event}}
+        )
+        save.assert_awaited_once()
+        assert save.await_args.args[0]["location"] == "SF"
+        assert agent._last_event_context["date"] == "2026-03-01"
+
+
+class TestWsEventBatching:
+    @pytest.mark.asyncio
+    async def test_tool_burst_is_sent_as_one_batch(
+        self, test_user_profile: dict, mock_tavily: AsyncMock
+    ) -> None:
+        ws_broadcast = AsyncMock()
+        agent = NexusAgent(
+            user_profile=test_user_profile,
+            tavily=mock_tavily,
+            mode=NexusMode.LIVE,
+            ws_broadcast=ws_broadcast,
+        )
+        await agent.execute_tool("tavily_search", {"query": "AI"})
+        await agent.execute_tool("tavily_search", {"query": "devtools"})
+        await asyncio.sleep(0.1)
+
+        ws_broadcast.assert_awaited_once()
+        frame = ws_broadcast.await_args.args[0]
+        assert frame["type"] == "batch"
+        assert [e["type"] for e in frame["events"]] == [
+            "agent:status",
+            "event:discovered",
+            "agent:status",
+            "event:discovered",
+        ]
+        await agent.flush_ws_events()
+
 
 class TestWaitRouting:
     @pytest.mark.asyncio
@@ -282,6 +354,114 @@ class TestWaitRouting:
         assert result["hours"] == 2
 
 
+class TestToolConcurrency:
+    @pytest.mark.asyncio
+    async def test_tavily_search_concurrency_is_bounded(
+        self, agent: NexusAgent, mock_tavily: AsyncMock
+    ) -> None:
+        in_flight = 0
+        peak = 0
+        search_result = mock_tavily.search.return_value
+
+        async def slow_search(**_: Any) -> TavilySearchResult:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return search_result
+
+        mock_tavily.search.side_effect = slow_search
+        await asyncio.gather(
+            *(
+                agent.execute_tool("tavily_search", {"query": f"q{i}"})
+                for i in range(10)
+            )
+        )
+        assert mock_tavily.search.await_count == 10
+        assert peak == _TOOL_CONCURRENCY["tavily_search"]
+
+
+class TestToolFailures:
+    @pytest.mark.asyncio
+    async def test_rate_limited_tool_returns_error(
+        self, agent: NexusAgent, mock_tavily: AsyncMock
+    ) -> None:
+        mock_tavily.search.side_effect = httpx.TimeoutException("timed out")
+        result = await agent.execute_tool("tavily_search", {"query": "AI"})
+        assert result == {"error": "timed out", "tool": "tavily_search"}
+
+    def test_transient_error_classification(self) -> None:
+        request = httpx.Request("POST", "https://api.yutori.com/v1/browsing/tasks")
+        too_many = httpx.HTTPStatusError(
+            "429", request=request, response=httpx.Response(429, request=request)
+        )
+        server = httpx.HTTPStatusError(
+            "500", request=request, response=httpx.Response(500, request=request)
+        )
+        assert _is_transient_tool_error(too_many)
+        assert _is_transient_tool_error(httpx.ReadTimeout("slow"))
+        assert not _is_transient_tool_error(server)
+        assert not _is_transient_tool_error(KeyError("query"))
+
+
+class TestToolCallKey:
+    def test_key_ignores_input_key_order(self) -> None:
+        a = _tool_call_key("tavily_search", {"query": "AI", "max_results": 5})
+        b = _tool_call_key("tavily_search", {"max_results": 5, "query": "AI"})
+        assert a == b
+
+    def test_key_distinguishes_tools(self) -> None:
+        inp = {"cypher": "MATCH (n) RETURN n"}
+        assert _tool_call_key("neo4j_query", inp) != _tool_call_key(
+            "neo4j_write", inp
+        )
+
+
+class TestToolResultCache:
+    @pytest.mark.asyncio
+    async def test_repeat_read_is_served_from_cache(
+        self, agent: NexusAgent, mock_neo4j: AsyncMock
+    ) -> None:
+        inp = {"cypher": "MATCH (n) RETURN n LIMIT 1"}
+        first = await agent.execute_tool("neo4j_query", inp)
+        second = await agent.execute_tool("neo4j_query", dict(inp))
+        assert first == second
+        mock_neo4j.execute_query.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_respaced_search_hits_cache(
+        self, agent: NexusAgent, mock_tavily: AsyncMock
+    ) -> None:
+        await agent.execute_tool("tavily_search", {"query": "AI meetups  SF"})
+        await agent.execute_tool("tavily_search", {"query": " ai Meetups sf"})
+        mock_tavily.search.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reordered_search_misses_cache(
+        self, agent: NexusAgent, mock_tavily: AsyncMock
+    ) -> None:
+        await agent.execute_tool("tavily_search", {"query": "flights SF to NYC"})
+        await agent.execute_tool("tavily_search", {"query": "flights NYC to SF"})
+        assert mock_tavily.search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, test_user_profile: dict) -> None:
+        agent = NexusAgent(user_profile=test_user_profile, mode=NexusMode.LIVE)
+        await agent.execute_tool("tavily_search", {"query": "AI"})
+        assert agent._tool_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_cache(
+        self, agent: NexusAgent, mock_neo4j: AsyncMock
+    ) -> None:
+        inp = {"cypher": "MATCH (n) RETURN n LIMIT 1"}
+        await agent.execute_tool("neo4j_query", inp)
+        await agent.execute_tool("neo4j_write", {"cypher": "CREATE (n:Test)"})
+        await agent.execute_tool("neo4j_query", inp)
+        assert mock_neo4j.execute_query.await_count == 2
+
+
 class TestUnknownTool:
     @pytest.mark.asyncio
     async def test_unknown_tool_returns_error(self, agent: NexusAgent) -> None:
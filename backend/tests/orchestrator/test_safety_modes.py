@@ -6,6 +6,7 @@ correct tool blocking, rate limiting, and permission rules.
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 from typing import Any
 from unittest.mock import AsyncMock
@@ -206,6 +207,26 @@ class TestCanaryMode:
         )
         assert agent._applies_today == initial + 1
 
+    async def test_concurrent_applies_respect_limit(
+        self, agent: NexusAgent
+    ) -> None:
+        """Parallel yutori_browse calls cannot overshoot the daily limit."""
+        agent._applies_today = 8
+        agent._last_reset_date = _today_str()
+
+        results = await asyncio.gather(
+            *(
+                agent.execute_tool(
+                    "yutori_browse",
+                    {"task": "Apply", "start_url": "https://lu.ma/event"},
+                )
+                for _ in range(5)
+            )
+        )
+        blocked = [r for r in results if r.get("status") == "blocked"]
+        assert len(blocked) == 3
+        assert agent._applies_today == 10
+
     async def test_allows_read_tools_regardless_of_limits(
         self, agent: NexusAgent
     ) -> None:
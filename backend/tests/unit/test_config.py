@@ -43,3 +43,21 @@ def test_settings_from_env(monkeypatch: pytest.MonkeyPatch):
     s = Settings(_env_file=None)  # type: ignore[call-arg]
     assert s.tavily_api_key == "tvly-test"
     assert s.nexus_mode == NexusMode.LIVE
+
+
+def test_get_settings_is_cached_and_frozen():
+    from pydantic import ValidationError
+
+    from app.core.config import get_settings
+
+    s = get_settings()
+    assert get_settings() is s
+    with pytest.raises(ValidationError):
+        s.nexus_mode = NexusMode.LIVE  # type: ignore[misc]
+
+
+def test_module_settings_resolves_lazily_to_cached_instance():
+    import app.core.config as config
+
+    assert "settings" not in vars(config)
+    assert config.settings is config.get_settings()
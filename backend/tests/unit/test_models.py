@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 
 import pytest
+from pydantic import ValidationError
 
 from app.models.event import (
     EnrichedEvent,
@@ -13,10 +14,16 @@ from app.models.event import (
     EventStatus,
     EventType,
     RawEvent,
+    Speaker,
 )
 from app.models.feedback import Feedback, FeedbackAction, RejectionReason
 from app.models.message import ColdMessage, MessageChannel, MessageCreate, MessageStatus
-from app.models.person import PersonProfile, RawAttendee, SocialLinks
+from app.models.person import (
+    MutualConnection,
+    PersonProfile,
+    RawAttendee,
+    SocialLinks,
+)
 from app.models.profile import (
     MessageTone,
     ScoringWeights,
@@ -132,6 +139,23 @@ class TestEnrichedEvent:
         assert event.relevance_score == 85
         assert event.status == EventStatus.DISCOVERED
 
+    def test_speakers_are_typed(self) -> None:
+        event = EnrichedEvent(
+            id="evt-1",
+            url="https://lu.ma/test",
+            title="AI Dinner",
+            description="A dinner for AI founders",
+            source=EventSource.LUMA,
+            event_type=EventType.DINNER,
+            date=datetime(2026, 3, 15, 18, 0),
+            location="San Francisco, CA",
+            relevance_score=85,
+            speakers=[{"name": "Sarah Chen", "role": "Partner", "company": "Sequoia"}],
+        )
+        assert event.speakers == [
+            Speaker(name="Sarah Chen", role="Partner", company="Sequoia")
+        ]
+
     def test_relevance_score_lower_bound(self) -> None:
         with pytest.raises(ValueError):
             EnrichedEvent(
@@ -241,6 +265,10 @@ class TestPersonModels:
         assert a.name == "Jane Doe"
         assert a.linkedin is None
 
+    def test_raw_attendee_name_is_bounded(self) -> None:
+        with pytest.raises(ValidationError):
+            RawAttendee(name="x" * 256)
+
     def test_social_links(self) -> None:
         sl = SocialLinks(linkedin="linkedin.com/in/test")
         assert sl.twitter is None
@@ -255,6 +283,20 @@ class TestPersonModels:
         with pytest.raises(ValueError):
             PersonProfile(id="p-1", name="Jane", connection_score=101)
 
+    def test_mutual_connections_are_typed(self) -> None:
+        pp = PersonProfile(
+            id="p-1",
+            name="Jane",
+            connection_score=50,
+            mutual_connections=[{"name": "Bob Jones", "company": "Acme"}],
+        )
+        assert pp.mutual_connections == [MutualConnection(name="Bob Jones", company="Acme")]
+
+    def test_person_profile_is_frozen(self) -> None:
+        pp = PersonProfile(id="p-1", name="Jane", connection_score=50)
+        with pytest.raises(ValidationError):
+            pp.connection_score = 60  # type: ignore[misc]
+
 
 # ── Message models ─────────────────────────────────────────────────────────────
 
@@ -441,3 +483,20 @@ class TestSerialization:
         restored = Feedback(**dumped)
         assert restored.rating == 4
         assert restored.action == FeedbackAction.RATE
+
+
+# ── Package re-exports ─────────────────────────────────────────────────────────
+
+
+class TestLazyExports:
+    def test_exports_resolve_to_defining_module(self) -> None:
+        import app.models as models
+
+        assert models.EnrichedEvent is EnrichedEvent
+        assert set(models.__all__) == set(models._LAZY)
+
+    def test_unknown_export_raises(self) -> None:
+        import app.models as models
+
+        with pytest.raises(AttributeError):
+            models.NotAModel  # noqa: B018
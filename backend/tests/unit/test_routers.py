@@ -1,7 +1,12 @@
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.models.event import EventStatus
+from app.routers import chat as chat_router
+from app.routers import events as events_router
 
 client = TestClient(app)
 
@@ -26,6 +31,66 @@ class TestEventsRouter:
         assert response.status_code == 404
 
 
+class TestEventsStatusIndex:
+    @pytest.fixture(autouse=True)
+    def _clean_store(self):
+        yield
+        events_router._events.clear()
+        events_router._events_by_status.clear()
+
+    async def test_status_change_moves_bucket(self):
+        await events_router.attend_event("evt-1")
+        await events_router.skip_attend_event("evt-2")
+        await events_router.skip_attend_event("evt-1")
+
+        skipped = await events_router.list_events(
+            status=EventStatus.SKIPPED, limit=20, offset=0
+        )
+        attended = await events_router.list_events(
+            status=EventStatus.ATTENDED, limit=20, offset=0
+        )
+        assert [e["id"] for e in skipped] == ["evt-2", "evt-1"]
+        assert attended == []
+
+    async def test_list_without_status_pages_all(self):
+        for i in range(3):
+            await events_router.attend_event(f"evt-{i}")
+        page = await events_router.list_events(status=None, limit=2, offset=1)
+        assert [e["id"] for e in page] == ["evt-1", "evt-2"]
+
+
+class TestChatStreamCoalescing:
+    async def test_buffered_text_flushes_during_a_pause(self):
+        log: list[object] = []
+
+        async def tokens():
+            yield "Hello"
+            await asyncio.sleep(0.3)  # model pauses mid-reply
+            log.append("resumed")
+            yield " world"
+
+        parts: list[str] = []
+        async for chunk in chat_router._coalesced_text_frames(tokens(), parts):
+            log.append(chunk)
+
+        assert log == [
+            chat_router._sse_text("Hello"),
+            "resumed",
+            chat_router._sse_text(" world"),
+        ]
+        assert parts == ["Hello", " world"]
+
+    async def test_burst_is_sent_as_one_chunk(self):
+        async def tokens():
+            for t in ("a", "b", "c"):
+                yield t
+
+        chunks = [
+            c async for c in chat_router._coalesced_text_frames(tokens(), [])
+        ]
+        assert chunks == [b"".join(chat_router._sse_text(t) for t in "abc")]
+
+
 class TestPeopleRouter:
     def test_list_people_empty(self):
         response = client.get("/api/people")
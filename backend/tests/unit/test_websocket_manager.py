@@ -2,23 +2,43 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-from unittest.mock import AsyncMock, MagicMock
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import msgpack
 import pytest
 
 from app.core.websocket import ConnectionManager
 
 
 @pytest.fixture
-def mgr() -> ConnectionManager:
-    return ConnectionManager()
+async def mgr() -> AsyncIterator[ConnectionManager]:
+    manager = ConnectionManager(batch_delay=0)
+    yield manager
+    await manager.close()
+
+
+async def _drain() -> None:
+    """Let the per-connection writer tasks send what is queued."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def _sent_messages(ws: MagicMock) -> list[dict]:
+    """Decode every message sent to a mock socket, unpacking batched arrays."""
+    messages: list[dict] = []
+    for call in ws.send_bytes.await_args_list:
+        decoded = json.loads(call.args[0])
+        messages.extend(decoded if isinstance(decoded, list) else [decoded])
+    return messages
 
 
 def _make_ws(accept: bool = True) -> MagicMock:
     ws = AsyncMock()
     ws.accept = AsyncMock()
-    ws.send_text = AsyncMock()
+    ws.send_bytes = AsyncMock()
     return ws
 
 
@@ -65,19 +85,22 @@ class TestSendPersonal:
         await mgr.connect("user-2", ws2)
 
         await mgr.send_personal("user-1", {"type": "event:discovered"})
+        await _drain()
 
-        ws1.send_text.assert_awaited_once()
-        ws2.send_text.assert_not_awaited()
+        ws1.send_bytes.assert_awaited_once()
+        ws2.send_bytes.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_sends_json_string(self, mgr: ConnectionManager) -> None:
+    async def test_sends_json_bytes(self, mgr: ConnectionManager) -> None:
         ws = _make_ws()
         await mgr.connect("user-1", ws)
 
         msg = {"type": "event:analyzed", "data": {"id": "e-1"}}
         await mgr.send_personal("user-1", msg)
+        await _drain()
 
-        ws.send_text.assert_awaited_once_with(json.dumps(msg))
+        ws.send_bytes.assert_awaited_once()
+        assert json.loads(ws.send_bytes.await_args.args[0]) == msg
 
     @pytest.mark.asyncio
     async def test_send_to_nonexistent_user(self, mgr: ConnectionManager) -> None:
@@ -87,10 +110,11 @@ class TestSendPersonal:
     @pytest.mark.asyncio
     async def test_disconnects_on_error(self, mgr: ConnectionManager) -> None:
         ws = _make_ws()
-        ws.send_text = AsyncMock(side_effect=RuntimeError("closed"))
+        ws.send_bytes = AsyncMock(side_effect=RuntimeError("closed"))
         await mgr.connect("user-1", ws)
 
         await mgr.send_personal("user-1", {"type": "test"})
+        await _drain()
         assert mgr.active_count == 0
 
 
@@ -104,10 +128,12 @@ class TestBroadcast:
 
         msg = {"type": "agent:status", "data": {"status": "running"}}
         await mgr.broadcast(msg)
+        await _drain()
 
-        text = json.dumps(msg)
-        ws1.send_text.assert_awaited_once_with(text)
-        ws2.send_text.assert_awaited_once_with(text)
+        ws1.send_bytes.assert_awaited_once()
+        payload = ws1.send_bytes.await_args.args[0]
+        assert json.loads(payload) == msg
+        ws2.send_bytes.assert_awaited_once_with(payload)
 
     @pytest.mark.asyncio
     async def test_broadcast_to_empty(self, mgr: ConnectionManager) -> None:
@@ -120,15 +146,242 @@ class TestBroadcast:
     ) -> None:
         ws_good = _make_ws()
         ws_bad = _make_ws()
-        ws_bad.send_text = AsyncMock(side_effect=RuntimeError("closed"))
+        ws_bad.send_bytes = AsyncMock(side_effect=RuntimeError("closed"))
 
         await mgr.connect("good", ws_good)
         await mgr.connect("bad", ws_bad)
 
         await mgr.broadcast({"type": "test"})
+        await _drain()
 
         assert mgr.active_count == 1
-        ws_good.send_text.assert_awaited_once()
+        ws_good.send_bytes.assert_awaited_once()
+
+
+class TestSlowConsumer:
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_others(
+        self, mgr: ConnectionManager
+    ) -> None:
+        gate = asyncio.Event()
+
+        async def blocked_send(_: bytes) -> None:
+            await gate.wait()
+
+        ws_slow = _make_ws()
+        ws_slow.send_bytes = AsyncMock(side_effect=blocked_send)
+        ws_fast = _make_ws()
+        await mgr.connect("slow", ws_slow)
+        await mgr.connect("fast", ws_fast)
+
+        for i in range(3):
+            await mgr.broadcast({"type": "test", "data": {"i": i}})
+        await _drain()
+
+        assert [m["data"]["i"] for m in _sent_messages(ws_fast)] == [0, 1, 2]
+        gate.set()
+
+    @pytest.mark.asyncio
+    async def test_full_outbox_drops_oldest(self, mgr: ConnectionManager) -> None:
+        gate = asyncio.Event()
+
+        async def blocked_send(_: bytes) -> None:
+            await gate.wait()
+
+        ws = _make_ws()
+        ws.send_bytes = AsyncMock(side_effect=blocked_send)
+        await mgr.connect("user-1", ws)
+        await _drain()
+
+        outbox = mgr._outboxes["user-1"]
+        for i in range(outbox.maxsize + 5):
+            mgr._enqueue("user-1", str(i).encode())
+
+        assert outbox.full()
+        assert outbox.get_nowait() == b"5"
+        gate.set()
+
+    @pytest.mark.asyncio
+    async def test_persistently_slow_client_is_closed(
+        self, mgr: ConnectionManager
+    ) -> None:
+        gate = asyncio.Event()
+
+        async def blocked_send(_: bytes) -> None:
+            await gate.wait()
+
+        ws = _make_ws()
+        ws.send_bytes = AsyncMock(side_effect=blocked_send)
+        await mgr.connect("user-1", ws)
+        await _drain()
+
+        for i in range(mgr._outboxes["user-1"].maxsize + 64):
+            mgr._enqueue("user-1", str(i).encode())
+        await _drain()
+
+        assert mgr.active_count == 0
+        ws.close.assert_awaited_once_with(code=1013)
+        gate.set()
+
+
+class TestBatching:
+    @pytest.mark.asyncio
+    async def test_queued_frames_go_out_as_one_array(self) -> None:
+        mgr = ConnectionManager(batch_delay=0.01)
+        ws = _make_ws()
+        await mgr.connect("user-1", ws)
+
+        for i in range(3):
+            await mgr.send_personal("user-1", {"type": "test", "data": {"i": i}})
+        await asyncio.sleep(0.05)
+
+        ws.send_bytes.assert_awaited_once()
+        assert json.loads(ws.send_bytes.await_args.args[0]) == [
+            {"type": "test", "data": {"i": i}} for i in range(3)
+        ]
+        await mgr.close()
+
+    @pytest.mark.asyncio
+    async def test_lone_frame_is_sent_without_delay(self) -> None:
+        mgr = ConnectionManager(batch_delay=1.0)
+        ws = _make_ws()
+        await mgr.connect("user-1", ws)
+
+        await mgr.send_personal("user-1", {"type": "test"})
+        await _drain()
+
+        ws.send_bytes.assert_awaited_once()
+        await mgr.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_size_caps_each_message(self) -> None:
+        mgr = ConnectionManager(batch_size=2, batch_delay=0.01)
+        ws = _make_ws()
+        await mgr.connect("user-1", ws)
+
+        for i in range(5):
+            await mgr.send_personal("user-1", {"type": "test", "data": {"i": i}})
+        await asyncio.sleep(0.1)
+
+        assert ws.send_bytes.await_count == 3
+        assert len(_sent_messages(ws)) == 5
+        await mgr.close()
+
+
+class TestMsgpackWireFormat:
+    @pytest.mark.asyncio
+    async def test_single_frame_is_msgpack(self) -> None:
+        mgr = ConnectionManager(batch_delay=0, wire_format="msgpack")
+        ws = _make_ws()
+        await mgr.connect("user-1", ws)
+
+        msg = {"type": "agent:status", "data": {"status": "running"}}
+        await mgr.send_personal("user-1", msg)
+        await _drain()
+
+        assert msgpack.unpackb(ws.send_bytes.await_args.args[0]) == msg
+        await mgr.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("count", [3, 20])
+    async def test_queued_frames_go_out_as_one_msgpack_array(
+        self, count: int
+    ) -> None:
+        mgr = ConnectionManager(batch_delay=0.01, wire_format="msgpack")
+        ws = _make_ws()
+        await mgr.connect("user-1", ws)
+
+        for i in range(count):
+            await mgr.send_personal("user-1", {"type": "test", "data": {"i": i}})
+        await asyncio.sleep(0.05)
+
+        ws.send_bytes.assert_awaited_once()
+        assert msgpack.unpackb(ws.send_bytes.await_args.args[0]) == [
+            {"type": "test", "data": {"i": i}} for i in range(count)
+        ]
+        await mgr.close()
+
+
+class TestEventPersistence:
+    @staticmethod
+    def _session_factory() -> tuple[MagicMock, MagicMock]:
+        session = MagicMock()
+        session.execute = AsyncMock()
+        session.commit = AsyncMock()
+        factory = MagicMock()
+        factory.return_value.__aenter__ = AsyncMock(return_value=session)
+        factory.return_value.__aexit__ = AsyncMock(return_value=False)
+        return factory, session
+
+    @pytest.mark.asyncio
+    async def test_events_are_written_in_one_transaction(
+        self, mgr: ConnectionManager
+    ) -> None:
+        factory, session = self._session_factory()
+        with patch("app.core.database.async_session_factory", factory):
+            for i in range(3):
+                await mgr.broadcast({"type": "test", "data": {"i": i}})
+            await mgr.broadcast(
+                {"type": "batch", "events": [{"type": "test"}, {"type": "test"}]}
+            )
+            await mgr._flush_events()
+
+        factory.assert_called_once()
+        session.execute.assert_awaited_once()
+        rows = session.execute.await_args.args[1]
+        assert [r["event_type"] for r in rows] == ["test"] * 5
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_events(self) -> None:
+        mgr = ConnectionManager(batch_delay=0)
+        factory, session = self._session_factory()
+        with patch("app.core.database.async_session_factory", factory):
+            await mgr.broadcast({"type": "test"})
+            await mgr.close()
+
+        session.execute.assert_awaited_once()
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_large_backlog_is_chunked_into_multi_row_inserts(
+        self, mgr: ConnectionManager
+    ) -> None:
+        factory, session = self._session_factory()
+        with patch("app.core.database.async_session_factory", factory):
+            for i in range(2500):
+                mgr._persist_event({"type": "test", "data": {"i": i}})
+            await mgr._flush_events()
+
+        sizes = [len(c.args[1]) for c in session.execute.await_args_list]
+        assert sizes == [1000, 1000, 500]
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_events_for_retry(
+        self, mgr: ConnectionManager
+    ) -> None:
+        factory, session = self._session_factory()
+        session.commit.side_effect = [ConnectionError("db down"), None]
+        with patch("app.core.database.async_session_factory", factory):
+            mgr._persist_event({"type": "first"})
+            assert await mgr._flush_events() is False
+            mgr._persist_event({"type": "second"})
+            assert await mgr._flush_events() is True
+
+        rows = session.execute.await_args_list[-1].args[1]
+        assert [r["event_type"] for r in rows] == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_close_returns_while_flusher_idle(self) -> None:
+        mgr = ConnectionManager(batch_delay=0)
+        factory, _ = self._session_factory()
+        with patch("app.core.database.async_session_factory", factory):
+            await mgr.broadcast({"type": "test"})
+            await asyncio.sleep(0.3)  # past one flush interval: flusher is idle
+            await asyncio.wait_for(mgr.close(), timeout=1.0)
+
+        assert mgr._flusher is None
 
 
 class TestWSEventTypes:
@@ -157,5 +410,6 @@ class TestWSEventTypes:
         for event_type in self.EVENT_TYPES:
             msg = {"type": event_type, "data": {}, "priority": "medium"}
             await mgr.send_personal("user-1", msg)
+        await _drain()
 
-        assert ws.send_text.await_count == len(self.EVENT_TYPES)
+        assert [m["type"] for m in _sent_messages(ws)] == self.EVENT_TYPES
@@ -2,7 +2,7 @@
 
 import { useEffect, useRef, useState } from "react";
 import { useAuth } from "@/components/AuthProvider";
-import { agent } from "@/lib/api";
+import { agent, parseWSFrame, type WSMessage } from "@/lib/api";
 
 interface ActivityItem {
   id: string;
@@ -80,9 +80,34 @@ export default function ActivityPage() {
   useEffect(() => {
     if (!user?.user_id) return;
 
+    function handleEvent(m: WSMessage) {
+      const { type, data } = m;
+
+      if (type === "agent:status") {
+        setAgentStatus(data.status as string);
+      }
+
+      const source = (data.agent as string) || "wingman";
+      const message = _formatMessage(type, data);
+      const detail = _formatDetail(type, data);
+
+      setActivities((prev) => [
+        {
+          id: `ws-${wsNextId++}`,
+          type,
+          source,
+          message,
+          detail,
+          time: new Date().toLocaleTimeString(),
+        },
+        ...prev,
+      ]);
+    }
+
     function connect() {
       const wsBase = process.env.NEXT_PUBLIC_WS_URL || `ws://localhost:8000`;
       const ws = new WebSocket(`${wsBase}/ws/${user!.user_id}`);
+      ws.binaryType = "arraybuffer";
 
       ws.onopen = () => {
         setConnected(true);
@@ -94,29 +119,7 @@ export default function ActivityPage() {
 
       ws.onmessage = (event) => {
         try {
-          const msg = JSON.parse(event.data);
-          const type = msg.type as string;
-          const data = msg.data as Record<string, unknown>;
-
-          if (type === "agent:status") {
-            setAgentStatus(data.status as string);
-          }
-
-          const source = (data.agent as string) || "wingman";
-          const message = _formatMessage(type, data);
-          const detail = _formatDetail(type, data);
-
-          setActivities((prev) => [
-            {
-              id: `ws-${wsNextId++}`,
-              type,
-              source,
-              message,
-              detail,
-              time: new Date().toLocaleTimeString(),
-            },
-            ...prev,
-          ]);
+          for (const m of parseWSFrame(event.data)) handleEvent(m);
         } catch {
           // ignore
         }
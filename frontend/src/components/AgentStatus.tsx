@@ -3,7 +3,7 @@
 import Link from "next/link";
 import { useEffect, useRef, useState } from "react";
 import { useAuth } from "./AuthProvider";
-import { agent } from "@/lib/api";
+import { agent, parseWSFrame, type WSMessage } from "@/lib/api";
 
 interface ActivityItem {
   id: number;
@@ -58,9 +58,49 @@ export default function AgentStatus() {
   useEffect(() => {
     if (!user?.user_id) return;
 
+    function handleEvent(m: WSMessage) {
+      const { type, data } = m;
+
+      const source = (data.agent as string) || "wingman";
+      if (source === "chat") return;
+
+      if (type === "agent:status") {
+        const newStatus = data.status as string;
+        setStatus(newStatus);
+        window.dispatchEvent(new CustomEvent("agent:status", { detail: newStatus }));
+      }
+
+      // Toast for applied events
+      if (type === "event:applied") {
+        const ev = data.event as Record<string, string> | undefined;
+        window.dispatchEvent(
+          new CustomEvent("event:applied", {
+            detail: {
+              title: ev?.title,
+              paymentRequired: data.payment_required === true,
+            },
+          })
+        );
+      }
+
+      const labelFn = EVENT_LABELS[type];
+      const message = labelFn ? labelFn(data) : type;
+
+      setActivities((prev) => [
+        {
+          id: nextId++,
+          type,
+          message,
+          time: new Date().toLocaleTimeString(),
+        },
+        ...prev.slice(0, 9),
+      ]);
+    }
+
     function connect() {
       const wsBase = process.env.NEXT_PUBLIC_WS_URL || `ws://localhost:8000`;
       const ws = new WebSocket(`${wsBase}/ws/${user!.user_id}`);
+      ws.binaryType = "arraybuffer";
 
       ws.onopen = () => {
         setConnected(true);
@@ -72,44 +112,7 @@ export default function AgentStatus() {
 
       ws.onmessage = (event) => {
         try {
-          const msg = JSON.parse(event.data);
-          const type = msg.type as string;
-          const data = msg.data as Record<string, unknown>;
-
-          const source = (data.agent as string) || "wingman";
-          if (source === "chat") return;
-
-          if (type === "agent:status") {
-            const newStatus = data.status as string;
-            setStatus(newStatus);
-            window.dispatchEvent(new CustomEvent("agent:status", { detail: newStatus }));
-          }
-
-          // Toast for applied events
-          if (type === "event:applied") {
-            const ev = data.event as Record<string, string> | undefined;
-            window.dispatchEvent(
-              new CustomEvent("event:applied", {
-                detail: {
-                  title: ev?.title,
-                  paymentRequired: data.payment_required === true,
-                },
-              })
-            );
-          }
-
-          const labelFn = EVENT_LABELS[type];
-          const message = labelFn ? labelFn(data) : type;
-
-          setActivities((prev) => [
-            {
-              id: nextId++,
-              type,
-              message,
-              time: new Date().toLocaleTimeString(),
-            },
-            ...prev.slice(0, 9),
-          ]);
+          for (const m of parseWSFrame(event.data)) handleEvent(m);
         } catch {
           // ignore
         }
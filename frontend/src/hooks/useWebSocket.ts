@@ -1,19 +1,27 @@
 "use client";
 
 import { useEffect, useRef, useState, useCallback } from "react";
+import { parseWSFrame } from "@/lib/api";
 import type { WSEvents } from "@/lib/types";
 
-type WSEvent = {
+export type WSEvent = {
   [K in keyof WSEvents]: { type: K; data: WSEvents[K]; priority?: string };
 }[keyof WSEvents];
 
 const WS_RECONNECT_DELAY = 3000;
 
-export function useWebSocket(userId: string) {
+// A frame can carry a batch of events. onEvent is called once for each, in
+// order; lastEvent only reflects the final event of a frame.
+export function useWebSocket(userId: string, onEvent?: (event: WSEvent) => void) {
   const [connected, setConnected] = useState(false);
   const [lastEvent, setLastEvent] = useState<WSEvent | null>(null);
   const wsRef = useRef<WebSocket | null>(null);
   const reconnectRef = useRef<NodeJS.Timeout | null>(null);
+  const onEventRef = useRef(onEvent);
+
+  useEffect(() => {
+    onEventRef.current = onEvent;
+  }, [onEvent]);
 
   const connect = useCallback(() => {
     if (wsRef.current?.readyState === WebSocket.OPEN) return;
@@ -21,6 +29,7 @@ export function useWebSocket(userId: string) {
     const protocol = window.location.protocol === "https:" ? "wss:" : "ws:";
     const host = process.env.NEXT_PUBLIC_WS_URL || `${protocol}//${window.location.host}`;
     const ws = new WebSocket(`${host}/ws/${userId}`);
+    ws.binaryType = "arraybuffer";
 
     ws.onopen = () => {
       setConnected(true);
@@ -32,8 +41,9 @@ export function useWebSocket(userId: string) {
 
     ws.onmessage = (event) => {
       try {
-        const data = JSON.parse(event.data) as WSEvent;
-        setLastEvent(data);
+        const events = parseWSFrame(event.data) as unknown as WSEvent[];
+        for (const e of events) onEventRef.current?.(e);
+        if (events.length) setLastEvent(events[events.length - 1]);
       } catch {
         // ignore non-JSON messages
       }
@@ -1,3 +1,5 @@
+import { decode as decodeMsgpack } from "@msgpack/msgpack";
+
 const API_BASE = process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000";
 
 async function fetchApi<T>(path: string, options?: RequestInit): Promise<T> {
@@ -205,3 +207,30 @@ export const chat = {
   history: () => fetchApi<{ role: string; content: string }[]>("/api/chat/history"),
   clear: () => fetchApi("/api/chat/history", { method: "DELETE" }),
 };
+
+// WebSocket frames: UTF-8 JSON sent as binary. The server may group frames
+// into a JSON array, and agent "batch" frames carry several events.
+export interface WSMessage {
+  type: string;
+  data: Record<string, unknown>;
+}
+
+const wsDecoder = new TextDecoder();
+
+function unpackWS(msg: unknown): WSMessage[] {
+  if (Array.isArray(msg)) return msg.flatMap(unpackWS);
+  const m = msg as WSMessage & { events?: WSMessage[] };
+  return m.type === "batch" ? (m.events ?? []) : [m];
+}
+
+// JSON frames start with "{" or "["; anything else is MessagePack
+function decodeWS(raw: string | ArrayBuffer): unknown {
+  if (typeof raw === "string") return JSON.parse(raw);
+  const first = new Uint8Array(raw, 0, 1)[0];
+  if (first === 0x7b || first === 0x5b) return JSON.parse(wsDecoder.decode(raw));
+  return decodeMsgpack(raw);
+}
+
+export function parseWSFrame(raw: string | ArrayBuffer): WSMessage[] {
+  return unpackWS(decodeWS(raw));
+}
@@ -0,0 +1,33 @@
+"""Run every schema migration, in order.
+
+Each script is idempotent and skips tables that don't exist yet, so this
+is safe on every deploy: on a fresh database it does nothing and the API's
+create_all builds the current schema. render.yaml runs it before uvicorn.
+"""
+
+import asyncio
+
+import migrate_agent_events_partitions
+import migrate_enum_columns
+import migrate_server_defaults
+import migrate_text_columns
+import migrate_uuid_columns
+
+# uuid first: the id defaults installed later generate uuid values
+MIGRATIONS = (
+    migrate_uuid_columns,
+    migrate_enum_columns,
+    migrate_text_columns,
+    migrate_server_defaults,
+    migrate_agent_events_partitions,
+)
+
+
+async def migrate() -> None:
+    for module in MIGRATIONS:
+        print(f"{module.__name__}:")
+        await module.migrate()
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
@@ -0,0 +1,104 @@
+"""Rebuild agent_events as a table range-partitioned by month on created_at.
+
+The model keys agent_events on (pk_id BIGINT identity, created_at) and
+partitions it by month; create_all cannot convert an existing plain table,
+so older databases need this one-off migration. Rows are copied in
+created_at order, so pk_id follows insertion order. Indexes are recreated
+by create_missing_indexes on the next startup. Safe to re-run: an already
+partitioned table is skipped, as is a missing one (create_all makes it
+partitioned).
+"""
+
+import asyncio
+import os
+from datetime import datetime, timezone
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+MONTHS_AHEAD = 2
+
+_IS_PARTITIONED = text(
+    "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+    "WHERE c.relname = 'agent_events'"
+)
+
+_CREATE_PARENT = text(
+    """
+    CREATE TABLE agent_events (
+        pk_id bigint GENERATED ALWAYS AS IDENTITY,
+        id uuid NOT NULL DEFAULT gen_random_uuid(),
+        event_type varchar(64) NOT NULL,
+        source varchar(32) NOT NULL,
+        message text NOT NULL,
+        detail text NOT NULL,
+        data json,
+        created_at timestamptz NOT NULL DEFAULT clock_timestamp(),
+        PRIMARY KEY (pk_id, created_at)
+    ) PARTITION BY RANGE (created_at)
+    """
+)
+
+_COPY_ROWS = text(
+    """
+    INSERT INTO agent_events (id, event_type, source, message, detail, data, created_at)
+    SELECT id::uuid, event_type, source, message, detail, data,
+           coalesce(created_at, now())
+    FROM agent_events_unpartitioned
+    ORDER BY created_at
+    """
+)
+
+
+async def _create_partitions(conn: AsyncConnection, start: datetime) -> None:
+    now = datetime.now(timezone.utc)
+    year, month = start.year, start.month
+    end = (now.year * 12 + now.month - 1) + MONTHS_AHEAD
+    while year * 12 + month - 1 <= end:
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        await conn.execute(
+            text(
+                f"CREATE TABLE agent_events_y{year}m{month:02d} "
+                "PARTITION OF agent_events FOR VALUES "
+                f"FROM ('{year}-{month:02d}-01 00:00+00') "
+                f"TO ('{next_year}-{next_month:02d}-01 00:00+00')"
+            )
+        )
+        print(f"  PARTITION: agent_events_y{year}m{month:02d}")
+        year, month = next_year, next_month
+    await conn.execute(
+        text("CREATE TABLE agent_events_default PARTITION OF agent_events DEFAULT")
+    )
+
+
+async def migrate() -> None:
+    url = os.getenv("DATABASE_URL", "")
+    if not url:
+        print("DATABASE_URL not set, skipping migration")
+        return
+
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        if await conn.scalar(text("SELECT to_regclass('agent_events')")) is None:
+            print("  SKIP: agent_events (missing)")
+        elif await conn.scalar(_IS_PARTITIONED):
+            print("  SKIP: agent_events is already partitioned")
+        else:
+            await conn.execute(
+                text("ALTER TABLE agent_events RENAME TO agent_events_unpartitioned")
+            )
+            oldest = await conn.scalar(
+                text("SELECT min(created_at) FROM agent_events_unpartitioned")
+            )
+            await conn.execute(_CREATE_PARENT)
+            await _create_partitions(
+                conn, (oldest or datetime.now(timezone.utc)).astimezone(timezone.utc)
+            )
+            result = await conn.execute(_COPY_ROWS)
+            await conn.execute(text("DROP TABLE agent_events_unpartitioned"))
+            print(f"  OK: copied {result.rowcount} agent events")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
@@ -0,0 +1,64 @@
+"""Convert native PostgreSQL ENUM columns to VARCHAR holding enum values.
+
+Older databases store these columns as native ENUM types labelled with the
+member *names* (e.g. DISCOVERED); the models now use VARCHAR(32) holding
+member values (e.g. discovered). Safe to re-run: columns that are already
+character varying are skipped.
+"""
+
+import asyncio
+import os
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+COLUMNS: dict[str, tuple[str, ...]] = {
+    "events": ("source", "event_type", "status"),
+    "feedback": ("action",),
+    "messages": ("channel", "status"),
+    "user_profiles": ("message_tone",),
+}
+
+_COLUMN_TYPE = text(
+    "SELECT data_type, udt_name FROM information_schema.columns "
+    "WHERE table_name = :table AND column_name = :column"
+)
+
+
+async def migrate() -> None:
+    url = os.getenv("DATABASE_URL", "")
+    if not url:
+        print("DATABASE_URL not set, skipping migration")
+        return
+
+    engine = create_async_engine(url)
+    enum_types: set[str] = set()
+    async with engine.begin() as conn:
+        for table, columns in COLUMNS.items():
+            for column in columns:
+                row = (
+                    await conn.execute(
+                        _COLUMN_TYPE, {"table": table, "column": column}
+                    )
+                ).first()
+                if row is None or row.data_type != "USER-DEFINED":
+                    found = row.data_type if row else "missing"
+                    print(f"  SKIP: {table}.{column} ({found})")
+                    continue
+                await conn.execute(
+                    text(
+                        f'ALTER TABLE "{table}" ALTER COLUMN "{column}" '
+                        f'TYPE varchar(32) USING lower("{column}"::text)'
+                    )
+                )
+                enum_types.add(row.udt_name)
+                print(f"  OK: {table}.{column}")
+
+        for enum_type in sorted(enum_types):
+            await conn.execute(text(f'DROP TYPE IF EXISTS "{enum_type}"'))
+            print(f"  DROPPED TYPE: {enum_type}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
@@ -0,0 +1,54 @@
+"""Install the server-side column defaults the models now rely on.
+
+agent_events and chat_messages no longer generate their id and created_at
+in Python, nor user_profiles its id; the database supplies them.
+create_all only sets defaults on new tables, so older databases need this
+one-off migration. Safe to re-run: setting a default is idempotent, and
+tables create_all hasn't made yet are skipped.
+"""
+
+import asyncio
+import os
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+DEFAULTS: dict[str, dict[str, str]] = {
+    "agent_events": {"id": "gen_random_uuid()", "created_at": "clock_timestamp()"},
+    "chat_messages": {"id": "gen_random_uuid()", "created_at": "now()"},
+    "user_profiles": {"id": "gen_random_uuid()"},
+}
+
+_COLUMN_EXISTS = text(
+    "SELECT 1 FROM information_schema.columns "
+    "WHERE table_name = :table AND column_name = :column"
+)
+
+
+async def migrate() -> None:
+    url = os.getenv("DATABASE_URL", "")
+    if not url:
+        print("DATABASE_URL not set, skipping migration")
+        return
+
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        for table, columns in DEFAULTS.items():
+            for column, default in columns.items():
+                if await conn.scalar(
+                    _COLUMN_EXISTS, {"table": table, "column": column}
+                ) is None:
+                    print(f"  SKIP: {table}.{column} (missing)")
+                    continue
+                await conn.execute(
+                    text(
+                        f'ALTER TABLE "{table}" ALTER COLUMN "{column}" '
+                        f"SET DEFAULT {default}"
+                    )
+                )
+                print(f"  OK: {table}.{column} DEFAULT {default}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
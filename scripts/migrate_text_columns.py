@@ -0,0 +1,59 @@
+"""Narrow short free-text columns from TEXT to bounded VARCHAR.
+
+Names, titles, companies, locations and URLs are now VARCHAR(255) or
+VARCHAR(2048) in the models; older databases still hold them as TEXT.
+Values longer than the new bound are truncated. Safe to re-run: columns
+that are already character varying are skipped.
+"""
+
+import asyncio
+import os
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+COLUMNS: dict[str, dict[str, int]] = {
+    "events": {"url": 2048, "title": 255, "location": 255},
+    "persons": {
+        "name": 255,
+        "title": 255,
+        "company": 255,
+        "linkedin": 2048,
+        "twitter": 2048,
+    },
+}
+
+_COLUMN_TYPE = text(
+    "SELECT data_type FROM information_schema.columns "
+    "WHERE table_name = :table AND column_name = :column"
+)
+
+
+async def migrate() -> None:
+    url = os.getenv("DATABASE_URL", "")
+    if not url:
+        print("DATABASE_URL not set, skipping migration")
+        return
+
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        for table, columns in COLUMNS.items():
+            for column, length in columns.items():
+                data_type = await conn.scalar(
+                    _COLUMN_TYPE, {"table": table, "column": column}
+                )
+                if data_type != "text":
+                    print(f"  SKIP: {table}.{column} ({data_type or 'missing'})")
+                    continue
+                await conn.execute(
+                    text(
+                        f'ALTER TABLE "{table}" ALTER COLUMN "{column}" '
+                        f'TYPE varchar({length}) USING left("{column}", {length})'
+                    )
+                )
+                print(f"  OK: {table}.{column}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
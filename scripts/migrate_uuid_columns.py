@@ -0,0 +1,57 @@
+"""Convert id columns created as VARCHAR(36) to native PostgreSQL UUID.
+
+Base.metadata.create_all only creates missing tables, so databases created
+before the models switched to UUID columns need this one-off migration.
+Safe to re-run: columns that are already uuid are skipped.
+"""
+
+import asyncio
+import os
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+COLUMNS: dict[str, tuple[str, ...]] = {
+    "agent_events": ("id",),
+    "chat_messages": ("id", "user_id"),
+    "events": ("id",),
+    "feedback": ("id", "user_id", "event_id", "person_id", "message_id"),
+    "messages": ("id", "recipient_id", "event_id"),
+    "persons": ("id",),
+    "user_profiles": ("id",),
+}
+
+_COLUMN_TYPE = text(
+    "SELECT data_type FROM information_schema.columns "
+    "WHERE table_name = :table AND column_name = :column"
+)
+
+
+async def migrate() -> None:
+    url = os.getenv("DATABASE_URL", "")
+    if not url:
+        print("DATABASE_URL not set, skipping migration")
+        return
+
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        for table, columns in COLUMNS.items():
+            for column in columns:
+                data_type = await conn.scalar(
+                    _COLUMN_TYPE, {"table": table, "column": column}
+                )
+                if data_type is None or data_type == "uuid":
+                    print(f"  SKIP: {table}.{column} ({data_type or 'missing'})")
+                    continue
+                await conn.execute(
+                    text(
+                        f'ALTER TABLE "{table}" ALTER COLUMN "{column}" '
+                        f'TYPE uuid USING "{column}"::uuid'
+                    )
+                )
+                print(f"  OK: {table}.{column}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate())